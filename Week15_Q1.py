@@ -1,33 +1,255 @@
+import bisect
+import csv
+import heapq
+import json
+from array import array
+from collections import OrderedDict, deque
+
+
 class Network:
     # Initialize an empty Networks
     def __init__(self):
         self.members = []
         self.relationships = []
+        self.members_by_name = {}  # Name -> member, so lookups do not scan the member list
+        self.friendships = set()  # (name, name) pairs in sorted order, one per relationship
+        self.landmarks = []  # Members used by the distance oracle, empty until build_landmark_index
+        self.landmark_distances = []  # One {member: distance} dictionary per landmark
+        self.mutual_counts = None  # {member: {candidate: mutual friends}}, None until enable_recommendations
+        self.recommendation_cache = OrderedDict()  # Name -> (k, ranked list), least recently used first
+        self.recommendation_cache_size = 0
+        self.members_by_age = []  # Sorted (age, name) pairs of every member
+        self.members_by_location = {}  # Location -> sorted (age, name) pairs of the members living there
 
-    # Create a new member
-    def add_member(self, name, age, location):
+    # Create a new member, names are unique so a repeated name is ignored
+    # Bulk imports pass sort_index=False and sort the indexes once at the end with sort_indexes
+    def add_member(self, name, age, location, sort_index=True):
+        if name in self.members_by_name:
+            return None
         member = Node(name, age, location)
         self.members.append(member)
+        self.members_by_name[name] = member
+        if sort_index:
+            bisect.insort(self.members_by_age, (age, name))
+            bisect.insort(self.members_by_location.setdefault(location, []), (age, name))
+        else:
+            self.members_by_age.append((age, name))
+            self.members_by_location.setdefault(location, []).append((age, name))
+        return member
+
+    # Sort the indexes after members were added with sort_index=False
+    def sort_indexes(self):
+        self.members_by_age.sort()
+        for entries in self.members_by_location.values():
+            entries.sort()
+
+    # Slice of the age index for the range, limited to one location when it is given
+    def age_range(self, min_age=None, max_age=None, location=None):
+        entries = self.members_by_age if location is None else self.members_by_location.get(location, [])
+        low = 0 if min_age is None else bisect.bisect_left(entries, (min_age,))
+        # (max_age + 1,) sorts before every (max_age + 1, name), so whole ages are kept
+        high = len(entries) if max_age is None else bisect.bisect_left(entries, (max_age + 1,))
+        return entries, low, max(low, high)
+
+    # Names of the members matching an age range and/or location, found through the indexes
+    def find_members(self, min_age=None, max_age=None, location=None):
+        entries, low, high = self.age_range(min_age, max_age, location)
+        return [name for _, name in entries[low:high]]
 
     # Search for a member by name
     def find_member_by_name(self, name):
-        for member in self.members:
-            if member.name == name:
-                return member
-        return None
+        return self.members_by_name.get(name)
 
     # Add a bidirectional relationship
     def add_relationship(self, first_name, second_name):
         first_member = self.find_member_by_name(first_name)
         second_member = self.find_member_by_name(second_name)
-        if first_member and second_member:  # check if members exist
+        key = friendship_key(first_name, second_name)
+        if first_member and second_member and first_member is not second_member \
+                and key not in self.friendships:  # check if members exist and are not friends yet
             first_member.friends.append(second_member)  # if it is, 1. add friends
             second_member.friends.append(first_member)
             relationship = Graph(first_member, second_member)  # 2.make relationship (graph between nodes)
             self.relationships.append(relationship)  # 3. add relationship
-        else:  # if it is not, at least one account does not exist
+            self.friendships.add(key)
+            self.update_landmark_distances(first_member, second_member)
+            self.update_mutual_counts(first_member, second_member)
+        else:  # if it is not, at least one account does not exist or the friendship is already there
             pass
 
+    # Check whether two members are friends
+    def are_friends(self, first_name, second_name):
+        return friendship_key(first_name, second_name) in self.friendships
+
+    # Friends of friends of a member (not the member or their friends), filtered by location and age
+    # Walks whichever does less work: the two-step neighbourhood or the matching slice of the indexes
+    def friends_of_friends(self, name, location=None, min_age=None, max_age=None):
+        member = self.find_member_by_name(name)
+        if not member:
+            return []
+        friends = set(member.friends)
+        entries, low, high = self.age_range(min_age, max_age, location)
+        two_step_size = sum(len(friend.friends) for friend in member.friends)
+
+        if high - low < two_step_size:
+            # Checking a candidate can scan all of its friends, so the slice walk is charged for them and gives up
+            # as soon as it has done more work than the two-step walk needs
+            budget = two_step_size
+            result = []
+            for i in range(low, high):
+                candidate = self.members_by_name[entries[i][1]]
+                budget -= 1 + len(candidate.friends)
+                if budget < 0:
+                    break
+                if candidate is not member and candidate not in friends and not friends.isdisjoint(candidate.friends):
+                    result.append(candidate.name)
+            else:
+                return result
+
+        result = set()
+        for friend in member.friends:
+            for candidate in friend.friends:
+                if candidate is not member and candidate not in friends \
+                        and (location is None or candidate.location == location) \
+                        and (min_age is None or candidate.age >= min_age) \
+                        and (max_age is None or candidate.age <= max_age):
+                    result.add(candidate.name)
+        return sorted(result, key=lambda candidate_name: (self.members_by_name[candidate_name].age, candidate_name))
+
+    # Precompute BFS distances from a set of landmark members for fast degrees-of-separation bounds
+    # Without names, the best connected members are used because most shortest chains pass near them
+    def build_landmark_index(self, count=8, names=None):
+        if names is None:
+            candidates = sorted(self.members, key=lambda member: len(member.friends), reverse=True)[:count]
+        else:
+            candidates = [self.find_member_by_name(name) for name in names]
+        self.landmarks = [member for member in candidates if member]
+        self.landmark_distances = [bfs_distances(landmark) for landmark in self.landmarks]
+
+    # Keep landmark distances exact after a new edge, only members that got closer are revisited
+    def update_landmark_distances(self, first_member, second_member):
+        for distances in self.landmark_distances:
+            first_distance = distances.get(first_member)
+            second_distance = distances.get(second_member)
+            if first_distance is not None and (second_distance is None or first_distance + 1 < second_distance):
+                relax_distances(distances, second_member, first_distance + 1)
+            elif second_distance is not None and (first_distance is None or second_distance + 1 < first_distance):
+                relax_distances(distances, first_member, second_distance + 1)
+
+    # Lower and upper bound on the degrees of separation from the landmark distances
+    # The upper bound is None when no landmark reaches both members, and the result is None when
+    # a landmark reaches only one of them, since they are then in different parts of the network
+    def distance_bounds(self, first_name, second_name):
+        first_member = self.find_member_by_name(first_name)
+        second_member = self.find_member_by_name(second_name)
+        if not first_member or not second_member:
+            return None
+        if first_member is second_member:
+            return 0, 0
+        lower, upper = 1, None
+        for distances in self.landmark_distances:
+            first_distance = distances.get(first_member)
+            second_distance = distances.get(second_member)
+            if first_distance is None and second_distance is None:
+                continue
+            if first_distance is None or second_distance is None:
+                return None
+            lower = max(lower, abs(first_distance - second_distance))
+            through = first_distance + second_distance
+            upper = through if upper is None else min(upper, through)
+        return lower, upper
+
+    # Degrees of separation answered from the landmark index, None when the members are not connected
+    # With exact=False the landmark upper bound is returned whenever it exists, which needs no search
+    def degrees_of_separation(self, first_name, second_name, exact=True):
+        bounds = self.distance_bounds(first_name, second_name)
+        if bounds is None:
+            return None
+        lower, upper = bounds
+        if upper is not None and (lower == upper or not exact):
+            return upper
+        # Otherwise a search bounded by the upper bound finds the exact answer
+        return self.shortest_path(first_name, second_name, upper)
+
+    # Start counting mutual friends for every pair of members two steps apart
+    def enable_recommendations(self, cache_size=1024):
+        self.mutual_counts = {}
+        for member in self.members:
+            for i, first_friend in enumerate(member.friends):
+                for second_friend in member.friends[i + 1:]:
+                    self.count_mutual_friend(first_friend, second_friend)
+        self.recommendation_cache.clear()
+        self.recommendation_cache_size = cache_size
+
+    # Record one more mutual friend shared by two members
+    def count_mutual_friend(self, first_member, second_member):
+        first_counts = self.mutual_counts.setdefault(first_member, {})
+        first_counts[second_member] = first_counts.get(second_member, 0) + 1
+        second_counts = self.mutual_counts.setdefault(second_member, {})
+        second_counts[first_member] = second_counts.get(first_member, 0) + 1
+
+    # A new friendship makes each member a mutual friend of the other one and their existing friends
+    def update_mutual_counts(self, first_member, second_member):
+        if self.mutual_counts is None:
+            return
+        for friend in first_member.friends:
+            if friend is not second_member:
+                self.count_mutual_friend(second_member, friend)
+        for friend in second_member.friends:
+            if friend is not first_member:
+                self.count_mutual_friend(first_member, friend)
+        # Only the two members and their friends have different counts now
+        for member in [first_member, second_member] + first_member.friends + second_member.friends:
+            self.recommendation_cache.pop(member.name, None)
+
+    # "People you may know": up to k non-friends ranked by mutual friends, then by name
+    def recommend_friends(self, name, k=10):
+        member = self.find_member_by_name(name)
+        if not member:
+            return []
+        if self.mutual_counts is None:
+            self.enable_recommendations()
+        cached = self.recommendation_cache.get(name)
+        if cached is not None and cached[0] >= k:
+            self.recommendation_cache.move_to_end(name)
+            return cached[1][:k]
+
+        candidates = ((count, candidate.name) for candidate, count in self.mutual_counts.get(member, {}).items()
+                      if not self.are_friends(name, candidate.name))
+        ranked = [(candidate_name, count) for count, candidate_name in
+                  heapq.nsmallest(k, candidates, key=lambda item: (-item[0], item[1]))]
+
+        self.recommendation_cache[name] = (k, ranked)
+        self.recommendation_cache.move_to_end(name)
+        if len(self.recommendation_cache) > self.recommendation_cache_size:
+            self.recommendation_cache.popitem(last=False)  # Evict the least recently used member
+        return ranked
+
+    # Import members from a CSV (name,age,location header) or JSONL file, one row at a time
+    def load_members(self, path):
+        # Members are appended to the indexes and sorted once, inserting each in order would make big imports quadratic
+        added = 0
+        try:
+            for row in read_rows(path):
+                if self.add_member(row['name'], int(row['age']), row['location'], sort_index=False):
+                    added += 1
+        finally:
+            self.sort_indexes()
+        return added
+
+    # Import relationships from a CSV (first,second header) or JSONL file, one row at a time
+    def load_relationships(self, path):
+        before = len(self.relationships)
+        for row in read_rows(path):
+            self.add_relationship(row['first'], row['second'])
+        return len(self.relationships) - before
+
+    # Import members first, then relationships, so every relationship can find its members
+    def bulk_load(self, members_path=None, relationships_path=None):
+        members_added = self.load_members(members_path) if members_path else 0
+        relationships_added = self.load_relationships(relationships_path) if relationships_path else 0
+        return members_added, relationships_added
+
     # Printing network information
     def print_information(self):
         member_names = [member.name for member in self.members]
@@ -43,27 +265,150 @@ class Network:
         return []
 
     # Find the least number of edges between two users using BFS
-    def shortest_path(self, start_name, end_name):
+    def shortest_path(self, start_name, end_name, max_depth=None):
+        chain = self.shortest_chain(start_name, end_name, max_depth)
+        if chain is None:
+            return None  # Member or members do not exist, or they are not connected
+        return len(chain) - 1
+
+    # Find the names along a shortest chain of friends, searching from both members at once
+    # Returns None when there is no chain of at most max_depth relationships
+    def shortest_chain(self, start_name, end_name, max_depth=None):
         start_member = self.find_member_by_name(start_name)
         end_member = self.find_member_by_name(end_name)
         if not start_member or not end_member:
             return None  # Member or members do not exist
+        chain = bidirectional_search(start_member, end_member, friends_of_member, max_depth)
+        if chain is None:
+            return None
+        return [member.name for member in chain]
+
+    # Build the compact, read-only version of this network
+    def freeze(self):
+        return FrozenNetwork.from_network(self)
+
+
+# Read-only network with integer member IDs and CSR adjacency: the friends of member i are
+# neighbors[offsets[i]:offsets[i + 1]]. Two 4 byte entries per friendship instead of Python objects
+class FrozenNetwork:
+    def __init__(self, records, offsets, neighbors):
+        self.records = records  # MemberRecord per member ID
+        self.ids_by_name = {record.name: record.id for record in records}
+        self.offsets = offsets
+        self.neighbors = neighbors
 
-        visited = set()
-        queue = [(start_member, 0)]  # Initialize queue with the starting node
+    # Freeze a mutable Network, its friendships are already unique
+    @classmethod
+    def from_network(cls, network):
+        records = [MemberRecord(i, member.name, member.age, member.location)
+                   for i, member in enumerate(network.members)]
+        ids = {member: i for i, member in enumerate(network.members)}
+        offsets = array('I', [0])
+        neighbors = array('I')
+        for member in network.members:
+            neighbors.extend(sorted(ids[friend] for friend in member.friends))  # are_friends bisects the rows
+            offsets.append(len(neighbors))
+        return cls(records, offsets, neighbors)
 
-        while queue:
-            current_member, distance = queue.pop(0)  # Dequeue the next member
-            if current_member == end_member:
-                return distance
+    # Build straight from CSV/JSONL files without creating a mutable Network first
+    @classmethod
+    def from_files(cls, members_path, relationships_path):
+        records = []
+        ids = {}
+        for row in read_rows(members_path):
+            if row['name'] not in ids:
+                ids[row['name']] = len(records)
+                records.append(MemberRecord(len(records), row['name'], int(row['age']), row['location']))
 
-            if current_member not in visited:
-                visited.add(current_member)  # Mark the current node visited
-                for friend in current_member.friends:
-                    if friend not in visited:
-                        queue.append((friend, distance + 1))
+        # Edges are kept as two parallel integer arrays until they are sorted into rows
+        firsts = array('I')
+        seconds = array('I')
+        for row in read_rows(relationships_path):
+            first_id = ids.get(row['first'])
+            second_id = ids.get(row['second'])
+            if first_id is not None and second_id is not None and first_id != second_id:
+                firsts.append(first_id)
+                seconds.append(second_id)
+        return cls(records, *build_csr(len(records), firsts, seconds))
 
-        return None
+    def find_member_by_name(self, name):
+        member_id = self.ids_by_name.get(name)
+        return None if member_id is None else self.records[member_id]
+
+    def friend_ids(self, member_id):
+        return self.neighbors[self.offsets[member_id]:self.offsets[member_id + 1]]
+
+    def find_friends(self, name):
+        member_id = self.ids_by_name.get(name)
+        if member_id is None:
+            return []
+        return [self.records[friend_id].name for friend_id in self.friend_ids(member_id)]
+
+    def are_friends(self, first_name, second_name):
+        first_id = self.ids_by_name.get(first_name)
+        second_id = self.ids_by_name.get(second_name)
+        if first_id is None or second_id is None:
+            return False
+        # Rows are sorted, so a binary search finds the friend
+        friends = self.friend_ids(first_id)
+        i = bisect.bisect_left(friends, second_id)
+        return i < len(friends) and friends[i] == second_id
+
+    def shortest_path(self, start_name, end_name, max_depth=None):
+        chain = self.shortest_chain(start_name, end_name, max_depth)
+        if chain is None:
+            return None
+        return len(chain) - 1
+
+    def shortest_chain(self, start_name, end_name, max_depth=None):
+        start_id = self.ids_by_name.get(start_name)
+        end_id = self.ids_by_name.get(end_name)
+        if start_id is None or end_id is None:
+            return None
+        chain = bidirectional_search(start_id, end_id, self.friend_ids, max_depth)
+        if chain is None:
+            return None
+        return [self.records[member_id].name for member_id in chain]
+
+    def print_information(self):
+        print(f'Members: {len(self.records)} \nRelationships: {len(self.neighbors) // 2}')
+
+
+# Member of a FrozenNetwork, __slots__ keeps each record small
+class MemberRecord:
+    __slots__ = ('id', 'name', 'age', 'location')
+
+    def __init__(self, member_id, name, age, location):
+        self.id = member_id
+        self.name = name
+        self.age = age
+        self.location = location
+
+
+# Counting sort of undirected edges into CSR rows, with each row sorted and duplicates dropped
+def build_csr(count, firsts, seconds):
+    degrees = array('I', [0]) * (count + 1)
+    for first_id, second_id in zip(firsts, seconds):
+        degrees[first_id + 1] += 1
+        degrees[second_id + 1] += 1
+    for i in range(count):
+        degrees[i + 1] += degrees[i]  # Prefix sums turn the degrees into row starts
+
+    cursor = array('I', degrees)
+    neighbors = array('I', [0]) * degrees[count]
+    for first_id, second_id in zip(firsts, seconds):
+        neighbors[cursor[first_id]] = second_id
+        cursor[first_id] += 1
+        neighbors[cursor[second_id]] = first_id
+        cursor[second_id] += 1
+
+    offsets = array('I', [0])
+    unique = array('I')
+    for i in range(count):
+        row = sorted(set(neighbors[degrees[i]:degrees[i + 1]]))
+        unique.extend(row)
+        offsets.append(len(unique))
+    return offsets, unique
 
 
 # Initialize nodes
@@ -82,27 +427,140 @@ class Graph:
         self.second_member = second_member
 
 
-# Create a new social network
-network = Network()
+# Distance from the start member to every member it can reach
+def bfs_distances(start_member):
+    distances = {start_member: 0}
+    queue = deque([start_member])
+    while queue:
+        current_member = queue.popleft()
+        for friend in current_member.friends:
+            if friend not in distances:
+                distances[friend] = distances[current_member] + 1
+                queue.append(friend)
+    return distances
+
+
+# Lower the distance of a member and spread the improvement to its friends
+def relax_distances(distances, member, distance):
+    distances[member] = distance
+    queue = deque([member])
+    while queue:
+        current_member = queue.popleft()
+        next_distance = distances[current_member] + 1
+        for friend in current_member.friends:
+            known = distances.get(friend)
+            if known is None or next_distance < known:
+                distances[friend] = next_distance
+                queue.append(friend)
+
+
+# Friends of a Network member, used where a search takes a friends function
+def friends_of_member(member):
+    return member.friends
+
+
+# BFS from both ends at once over any graph given by a friends function
+# Returns the members (or member IDs) of a shortest chain, or None if none has at most max_depth edges
+def bidirectional_search(start, end, friends_of, max_depth=None):
+    if start == end:
+        return [start]
+
+    # Each side maps the members it reached to the member it came from
+    forward_parents = {start: None}
+    backward_parents = {end: None}
+    forward_queue = deque([start])
+    backward_queue = deque([end])
+    depth = 0  # Levels expanded so far by both sides together
+
+    while forward_queue and backward_queue:
+        if max_depth is not None and depth >= max_depth:
+            return None  # Any chain found now would be longer than max_depth
+        depth += 1
+        # Expanding the smaller frontier keeps the number of explored members low
+        if len(forward_queue) <= len(backward_queue):
+            meeting = expand_level(forward_queue, forward_parents, backward_parents, friends_of)
+        else:
+            meeting = expand_level(backward_queue, backward_parents, forward_parents, friends_of)
+        if meeting is not None:
+            return join_chain(meeting, forward_parents, backward_parents)
+
+    return None
+
+
+# Visit one BFS level, stopping at the first member the other side already reached
+def expand_level(queue, parents, other_parents, friends_of):
+    for _ in range(len(queue)):
+        current_member = queue.popleft()
+        for friend in friends_of(current_member):
+            if friend not in parents:  # Members are marked when queued, so each is queued once
+                parents[friend] = current_member
+                if friend in other_parents:
+                    return friend
+                queue.append(friend)
+    return None
+
+
+# Members from the start member to the meeting member, then on to the end member
+def join_chain(meeting, forward_parents, backward_parents):
+    chain = []
+    member = meeting
+    while member is not None:
+        chain.append(member)
+        member = forward_parents[member]
+    chain.reverse()
+    member = backward_parents[meeting]
+    while member is not None:
+        chain.append(member)
+        member = backward_parents[member]
+    return chain
+
+
+# Same key for both directions of a friendship
+def friendship_key(first_name, second_name):
+    return (first_name, second_name) if first_name <= second_name else (second_name, first_name)
+
+
+# Stream dictionaries from a .jsonl file or a CSV file with a header row
+def read_rows(path):
+    with open(path, 'r', newline='') as file:
+        if path.endswith('.jsonl') or path.endswith('.json'):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(file):
+                yield row
+
+
+if __name__ == '__main__':
+    # Create a new social network
+    network = Network()
+
+    # Add some members to the network
+    network.add_member("Alice", age=25, location="New York")
+    network.add_member("Bob", age=30, location="Los Angeles")
+    network.add_member("Charlie", age=35, location="Chicago")
+    network.add_member("David", age=40, location="Seattle")
 
-# Add some members to the network
-network.add_member("Alice", age=25, location="New York")
-network.add_member("Bob", age=30, location="Los Angeles")
-network.add_member("Charlie", age=35, location="Chicago")
-network.add_member("David", age=40, location="Seattle")
+    # Add some relationships between members
+    network.add_relationship("Alice", "Bob")
+    network.add_relationship("Bob", "Charlie")
+    network.add_relationship("Charlie", "David")
 
-# Add some relationships between members
-network.add_relationship("Alice", "Bob")
-network.add_relationship("Bob", "Charlie")
-network.add_relationship("Charlie", "David")
+    # Find all the friends of Alice
+    alice_friends = network.find_friends("Alice")
+    print(alice_friends)  # Output: ["Bob"]
 
-# Find all the friends of Alice
-alice_friends = network.find_friends("Alice")
-print(alice_friends)  # Output: ["Bob"]
+    # Find the shortest path between Alice and David
+    shortest_path = network.shortest_path("Alice", "David")
+    print(shortest_path)  # Output: 3
 
-# Find the shortest path between Alice and David
-shortest_path = network.shortest_path("Alice", "David")
-print(shortest_path)  # Output: 3
+    # Printing all information about network
+    network.print_information()
 
-# Printing all information about network
-network.print_information()
+    # A friendship added out of ID order, then the frozen copy must agree with the mutable network on every pair
+    network.add_relationship("Charlie", "Alice")
+    frozen = network.freeze()
+    names = [member.name for member in network.members]
+    print(all(frozen.are_friends(first, second) == network.are_friends(first, second)
+              for first in names for second in names))  # Output: True
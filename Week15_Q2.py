@@ -1,23 +1,64 @@
+import math
+import random
+
+
 class Graph():
     def __init__(self):
         self.vertex = []
         self.adjacency_matrix = []
+        self.row_bits = []  # Each matrix row as an int, bit j is set when the vertex is connected to vertex j
+        self.components = UnionFind()  # Kept up to date by inserts, None after a removal until it is needed
 
     def add_vertex(self, vertex):
-        if vertex is not self.vertex:
+        if vertex not in self.vertex:
             self.vertex.append(vertex)
             # Adding a row and column to the adjacency matrix
             for row in self.adjacency_matrix:
                 row.append(0)
             self.adjacency_matrix.append([0] * len(self.vertex))
+            self.row_bits.append(0)
+            if self.components is not None:
+                self.components.add()
 
     def remove_vertex(self, vertex):
-        if vertex is self.vertex:
+        if vertex in self.vertex:
             position = self.vertex.index(vertex)
             self.vertex.pop(position)
             for row in self.adjacency_matrix:
                 row.pop(position)
             self.adjacency_matrix.pop(position)
+            self.row_bits.pop(position)
+            self.row_bits = [drop_bit(bits, position) for bits in self.row_bits]
+            self.components = None  # Union-find cannot split, so it is rebuilt on the next query
+
+    def add_vertices(self, vertices):
+        # Batch insert: every existing row is widened once instead of once per new vertex
+        known = set(self.vertex)
+        new_vertices = [vertex for vertex in dict.fromkeys(vertices) if vertex not in known]
+        if not new_vertices:
+            return
+        self.vertex.extend(new_vertices)
+        for row in self.adjacency_matrix:
+            row.extend([0] * len(new_vertices))
+        self.adjacency_matrix.extend([0] * len(self.vertex) for _ in new_vertices)
+        self.row_bits.extend([0] * len(new_vertices))
+        if self.components is not None:
+            self.components.extend(len(new_vertices))
+
+    def add_edges(self, edges):
+        # Batch insert with one position lookup table, keeping the union-find up to date like add_edge
+        index = {vertex: i for i, vertex in enumerate(self.vertex)}
+        components = self.components
+        for start, end in edges:
+            if start in index and end in index:
+                start_index = index[start]
+                end_index = index[end]
+                self.adjacency_matrix[start_index][end_index] = 1
+                self.adjacency_matrix[end_index][start_index] = 1
+                self.row_bits[start_index] |= 1 << end_index
+                self.row_bits[end_index] |= 1 << start_index
+                if components is not None:
+                    components.union(start_index, end_index)
 
     def output_matrix(self):
         for row in self.adjacency_matrix:
@@ -32,24 +73,315 @@ class Graph():
             self.adjacency_matrix[start_index][end_index] = 1
             self.adjacency_matrix[end_index][
                 start_index] = 1  # Added twice because graph is undirected and so the connections are bi-directional
+            self.row_bits[start_index] |= 1 << end_index
+            self.row_bits[end_index] |= 1 << start_index
+            if self.components is not None:
+                self.components.union(start_index, end_index)
+
+    def remove_edge(self, start, end):
+        if start in self.vertex and end in self.vertex:
+            start_index = self.vertex.index(start)
+            end_index = self.vertex.index(end)
+            if self.adjacency_matrix[start_index][end_index]:
+                self.adjacency_matrix[start_index][end_index] = 0
+                self.adjacency_matrix[end_index][start_index] = 0
+                self.row_bits[start_index] &= ~(1 << end_index)
+                self.row_bits[end_index] &= ~(1 << start_index)
+                self.components = None
+
+    def connected_components(self):
+        # Rebuilding the union-find from the bitset rows only after a removal
+        if self.components is None:
+            self.components = UnionFind(len(self.vertex))
+            for i, bits in enumerate(self.row_bits):
+                for j in set_bits(bits >> i):
+                    self.components.union(i, i + j)
+        return self.components
+
+    def component_count(self):
+        return self.connected_components().count
 
     def print_matrix(self):
-        print("  " + " ".join(self.vertex))  # Allinging header row
+        print("  " + " ".join(map(str, self.vertex)))  # Allinging header row
         for i, row in enumerate(self.adjacency_matrix):
             val = " ".join(map(str, row))  # Getting value for each element of matrix
             print(val)
 
     def dfs(self, vertex_index, visited):
-        visited[vertex_index] = True  # Marking the current vertex as visited
-        # Looping through the adjacency matrix row for the current vertex
-        for i, connected in enumerate(self.adjacency_matrix[vertex_index]):
-            if connected and not visited[i]:  # Enumerating over adjacency matrix and looking for unvisited connection
-                self.dfs(i, visited)
+        # Marking every vertex reachable from vertex_index, found without recursion
+        for i in set_bits(reachable_bits(self.row_bits, vertex_index)):
+            visited[i] = True
 
     def is_network_connected(self):
-        visited = [False] * len(self.vertex)
-        self.dfs(0, visited)
-        return all(visited)
+        return self.component_count() <= 1
+
+    def is_reachable_from_first(self):
+        # Full bitset traversal from the first vertex, without the union-find
+        if not self.vertex:
+            return True
+        return reachable_bits(self.row_bits, 0) == (1 << len(self.vertex)) - 1
+
+
+class SparseGraph():
+    # Same interface as Graph, but each vertex keeps a set of neighbour indexes instead of a matrix row,
+    # so adding a vertex or an edge is O(1) and memory grows with the number of edges
+    def __init__(self):
+        self.vertex = []
+        self.index = {}  # Vertex -> position in self.vertex
+        self.adjacency = []  # Set of neighbour positions for each vertex
+        self.components = UnionFind()  # Kept up to date by inserts, None after a removal until it is needed
+
+    def add_vertex(self, vertex):
+        if vertex not in self.index:
+            self.index[vertex] = len(self.vertex)
+            self.vertex.append(vertex)
+            self.adjacency.append(set())
+            if self.components is not None:
+                self.components.add()
+
+    def add_vertices(self, vertices):
+        # Batch insert of every vertex not in the graph yet
+        start = len(self.vertex)
+        for vertex in vertices:
+            if vertex not in self.index:
+                self.index[vertex] = len(self.vertex)
+                self.vertex.append(vertex)
+        added = len(self.vertex) - start
+        self.adjacency.extend(set() for _ in range(added))
+        if self.components is not None:
+            self.components.extend(added)
+
+    def add_edges(self, edges):
+        # Batch insert, keeping the union-find up to date like add_edge
+        index = self.index
+        adjacency = self.adjacency
+        components = self.components
+        for start, end in edges:
+            if start in index and end in index:
+                start_index = index[start]
+                end_index = index[end]
+                adjacency[start_index].add(end_index)
+                adjacency[end_index].add(start_index)
+                if components is not None:
+                    components.union(start_index, end_index)
+
+    def remove_vertex(self, vertex):
+        if vertex in self.index:
+            position = self.index.pop(vertex)
+            self.vertex.pop(position)
+            for neighbour in self.adjacency.pop(position):
+                if neighbour != position:  # A self-loop leaves with the vertex itself
+                    self.adjacency[neighbour - 1 if neighbour > position else neighbour].discard(position)
+            # Positions after the removed vertex move down by one
+            for i in range(position, len(self.vertex)):
+                self.index[self.vertex[i]] = i
+            for i, neighbours in enumerate(self.adjacency):
+                if any(neighbour > position for neighbour in neighbours):
+                    self.adjacency[i] = {neighbour - 1 if neighbour > position else neighbour
+                                         for neighbour in neighbours}
+            self.components = None  # Union-find cannot split, so it is rebuilt on the next query
+
+    def add_edge(self, start, end):
+        if start in self.index and end in self.index:  # Checking if vertices exist in the graph
+            start_index = self.index[start]
+            end_index = self.index[end]
+            self.adjacency[start_index].add(end_index)
+            self.adjacency[end_index].add(start_index)  # Undirected, so the connection goes both ways
+            if self.components is not None:
+                self.components.union(start_index, end_index)
+
+    def remove_edge(self, start, end):
+        if self.has_edge(start, end):
+            start_index = self.index[start]
+            end_index = self.index[end]
+            self.adjacency[start_index].discard(end_index)
+            self.adjacency[end_index].discard(start_index)
+            self.components = None
+
+    def connected_components(self):
+        # Rebuilding the union-find from the adjacency sets only after a removal
+        if self.components is None:
+            self.components = UnionFind(len(self.vertex))
+            for i, neighbours in enumerate(self.adjacency):
+                for neighbour in neighbours:
+                    if neighbour > i:
+                        self.components.union(i, neighbour)
+        return self.components
+
+    def component_count(self):
+        return self.connected_components().count
+
+    def has_edge(self, start, end):
+        return start in self.index and end in self.index and self.index[end] in self.adjacency[self.index[start]]
+
+    def matrix_rows(self):
+        # Dense rows are only built one at a time, when they are asked for
+        for neighbours in self.adjacency:
+            row = [0] * len(self.vertex)
+            for neighbour in neighbours:
+                row[neighbour] = 1
+            yield row
+
+    def output_matrix(self):
+        for row in self.matrix_rows():
+            print(row)
+
+    def print_matrix(self):
+        print("  " + " ".join(map(str, self.vertex)))  # Allinging header row
+        for row in self.matrix_rows():
+            print(" ".join(map(str, row)))
+
+    def reachable(self, vertex_index):
+        # Level by level traversal where each level is one set union, so the work stays in C
+        visited = {vertex_index}
+        frontier = [vertex_index]
+        while frontier:
+            reached = set().union(*[self.adjacency[i] for i in frontier])
+            reached -= visited
+            visited |= reached
+            frontier = list(reached)
+        return visited
+
+    def dfs(self, vertex_index, visited):
+        for i in self.reachable(vertex_index):
+            visited[i] = True
+
+    def is_network_connected(self):
+        return self.component_count() <= 1
+
+    def is_reachable_from_first(self):
+        # Full traversal from the first vertex, without the union-find
+        if not self.vertex:
+            return True
+        return len(self.reachable(0)) == len(self.vertex)
+
+
+class UnionFind():
+    # Disjoint sets over vertex positions 0..n-1 with path halving and union by size
+    def __init__(self, size=0):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.count = size  # Number of separate components
+
+    def add(self):
+        self.extend(1)
+
+    def extend(self, count):
+        self.parent.extend(range(len(self.parent), len(self.parent) + count))
+        self.size.extend([1] * count)
+        self.count += count
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, first, second):
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root == second_root:
+            return
+        if self.size[first_root] < self.size[second_root]:
+            first_root, second_root = second_root, first_root
+        self.parent[second_root] = first_root
+        self.size[first_root] += self.size[second_root]
+        self.count -= 1
+
+
+def reachable_bits(row_bits, start):
+    # Bitset traversal: the next frontier is the OR of the rows of the current one, minus visited vertices
+    visited = frontier = 1 << start
+    while frontier:
+        reached = 0
+        for i in set_bits(frontier):
+            reached |= row_bits[i]
+        frontier = reached & ~visited
+        visited |= frontier
+    return visited
+
+
+def set_bits(bits):
+    # Positions of the 1 bits, lowest first
+    digits = bin(bits)[:1:-1]  # Binary digits from the lowest bit up, without the '0b' prefix
+    i = digits.find('1')
+    while i != -1:
+        yield i
+        i = digits.find('1', i + 1)
+
+
+def drop_bit(bits, position):
+    # Removing one bit position and moving the higher bits down by one
+    return (bits & ((1 << position) - 1)) | ((bits >> (position + 1)) << position)
+
+
+# Seeded topology generators, each yields the edges between vertices 0..n-1
+def ring_edges(size, seed=None):
+    if size > 2:
+        for i in range(size):
+            yield i, (i + 1) % size
+    elif size == 2:
+        yield 0, 1
+
+
+def star_edges(size, seed=None):
+    for i in range(1, size):
+        yield 0, i
+
+
+def grid_edges(size, seed=None):
+    # Rows of width about sqrt(size), the last row may be shorter
+    width = max(1, math.isqrt(size))
+    for i in range(size):
+        if (i + 1) % width and i + 1 < size:
+            yield i, i + 1
+        if i + width < size:
+            yield i, i + width
+
+
+def tree_edges(size, seed=None, branching=2):
+    for i in range(1, size):
+        yield (i - 1) // branching, i
+
+
+def random_edges(size, seed=None, average_degree=4):
+    # Erdos-Renyi G(n, p) with p chosen for the average degree. Instead of testing all n^2 / 2 pairs,
+    # geometric jumps skip straight to the next edge, so the work grows with the number of edges
+    if size < 2:
+        return
+    probability = min(1.0, average_degree / (size - 1))
+    rng = random.Random(seed)
+    if probability >= 1.0:
+        for i in range(size):
+            for j in range(i):
+                yield i, j
+        return
+    log_skip = math.log(1.0 - probability)
+    i, j = 1, -1
+    while i < size:
+        j += 1 + int(math.log(1.0 - rng.random()) / log_skip)
+        while j >= i and i < size:
+            j -= i
+            i += 1
+        if i < size:
+            yield i, j
+
+
+TOPOLOGIES = {
+    'ring': ring_edges,
+    'star': star_edges,
+    'grid': grid_edges,
+    'tree': tree_edges,
+    'random': random_edges,
+}
+
+
+def generate_network(graph, topology, size, seed=0, **options):
+    # Filling a Graph or SparseGraph with vertices 0..size-1 and the topology's edges in one batch
+    graph.add_vertices(range(size))
+    graph.add_edges(TOPOLOGIES[topology](size, seed, **options))
+    return graph
 
 
 def create_ring_network(graph):
@@ -68,40 +400,41 @@ def create_star_network(graph):
         graph.add_edge("Center", "Node" + str(i))  # Adding edge from each vertices
 
 
-# Worksheet Example Usage
-# Create a network graph
-network = Graph()
+if __name__ == '__main__':
+    # Worksheet Example Usage
+    # Create a network graph
+    network = Graph()
 
-# Add vertices and connect them
-network.add_vertex("A")
-network.add_vertex("B")
-network.add_edge("A", "B")
+    # Add vertices and connect them
+    network.add_vertex("A")
+    network.add_vertex("B")
+    network.add_edge("A", "B")
 
-# Verify is all computers are connected
-network.is_network_connected()
-# Outputs True
+    # Verify is all computers are connected
+    network.is_network_connected()
+    # Outputs True
 
-# Add more computers to the network and connect them
-network.add_vertex("C")
-network.add_vertex("C")
-network.add_edge("C", "D")
+    # Add more computers to the network and connect them
+    network.add_vertex("C")
+    network.add_vertex("C")
+    network.add_edge("C", "D")
 
-# Verify is all computers are connected
-network.is_network_connected()
-# Outputs False
+    # Verify is all computers are connected
+    network.is_network_connected()
+    # Outputs False
 
-# Ring Network
-ring_network = Graph()
+    # Ring Network
+    ring_network = Graph()
 
-create_ring_network(ring_network)
-print("Ring Network Adjacency Matrix:")
-ring_network.output_matrix()
-print("Is Ring Network Connected:", ring_network.is_network_connected())
+    create_ring_network(ring_network)
+    print("Ring Network Adjacency Matrix:")
+    ring_network.output_matrix()
+    print("Is Ring Network Connected:", ring_network.is_network_connected())
 
-# Star Network
-star_network = Graph()
+    # Star Network
+    star_network = Graph()
 
-create_star_network(star_network)
-print("\nStar Network Adjacency Matrix:")
-star_network.output_matrix()
-print("Is Star Network Connected:", star_network.is_network_connected())
+    create_star_network(star_network)
+    print("\nStar Network Adjacency Matrix:")
+    star_network.output_matrix()
+    print("Is Star Network Connected:", star_network.is_network_connected())
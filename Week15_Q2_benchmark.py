@@ -0,0 +1,88 @@
+import argparse
+import json
+import time
+import tracemalloc
+
+from Week15_Q2 import Graph, SparseGraph, TOPOLOGIES, generate_network
+
+BACKENDS = {
+    'dense': Graph,
+    'sparse': SparseGraph,
+}
+
+
+def timed(function):
+    start_time = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start_time
+
+
+def peak_memory(function):
+    # Peak bytes allocated by Python while the function runs
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark(backend, topology, size, seed, measure_memory):
+    graph_class = BACKENDS[backend]
+    graph, insert_time = timed(lambda: generate_network(graph_class(), topology, size, seed))
+    # Batch inserts keep the union-find current, so the first query only reads its count
+    components, union_find_time = timed(graph.component_count)
+    connected, query_time = timed(graph.is_network_connected)
+    _, traversal_time = timed(graph.is_reachable_from_first)
+    row = {
+        'backend': backend,
+        'topology': topology,
+        'vertices': size,
+        'components': components,
+        'connected': connected,
+        'insert_s': insert_time,
+        'union_find_s': union_find_time,
+        'connected_query_s': query_time,
+        'traversal_s': traversal_time,
+    }
+    if measure_memory:
+        # Built again because tracemalloc slows allocation down and would distort the timings
+        row['peak_memory_mb'] = peak_memory(lambda: generate_network(graph_class(), topology, size, seed)) / 2 ** 20
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time insertion, connectivity checks and memory use of Week15_Q2 graphs.")
+    parser.add_argument('--topologies', nargs='+', choices=sorted(TOPOLOGIES), default=sorted(TOPOLOGIES))
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000, 100000, 1000000])
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument('--dense-limit', type=int, default=5000,
+                        help="largest size run with the dense matrix backend, which needs O(V^2) memory")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random topology")
+    parser.add_argument('--skip-memory', action='store_true', help="do not measure peak memory")
+    parser.add_argument('--json', action='store_true', help="print one JSON object per run instead of a table")
+    args = parser.parse_args()
+
+    columns = ['backend', 'topology', 'vertices', 'components', 'insert_s', 'union_find_s',
+               'connected_query_s', 'traversal_s']
+    if not args.skip_memory:
+        columns.append('peak_memory_mb')
+    if not args.json:
+        print(' '.join('{:>17}'.format(column) for column in columns))
+
+    for backend in args.backends:
+        for topology in args.topologies:
+            for size in args.sizes:
+                if backend == 'dense' and size > args.dense_limit:
+                    continue
+                row = benchmark(backend, topology, size, args.seed, not args.skip_memory)
+                if args.json:
+                    print(json.dumps(row))
+                else:
+                    print(' '.join('{:>17.6f}'.format(row[column]) if isinstance(row[column], float)
+                                   else '{:>17}'.format(row[column]) for column in columns), flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,41 @@
+import argparse
+import bisect
+import heapq
+import json
+import mmap
+import os
+import struct
+import sys
 import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import numpy as np
+except ImportError:
+    np = None #The vectorized graph builder is optional
+
+DICTIONARY_FILE = 'words_alpha.txt'
+CACHE_DIR = 'word_graph_cache'
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
 class Node:
     def __init__(self, word): 
         self.word = word #The word represnted by the node
         self.neighbors = [] #Initializing an empty list of neighbors
-        self.visited = False #For marking visited nodes during BFS Search
-        self.parent = None #Tracking relationships during BFS search
+        self.component = None #ID of the connected component the word belongs to
    
 class Network:
-    def __init__(self, words_list): #List of all words
+    def __init__(self, words_list, backend='python'): #List of all words
         self.words_list = words_list
         self.nodes_dict = {word: Node(word) for word in words_list} #Making a dictonary where each object is itself
-        self.make_neighbors_network() #Creating the network
+        if backend == 'numpy':
+            self.make_neighbors_network_numpy()
+        else:
+            self.make_neighbors_network() #Creating the network
+        self.component_sizes = [] #Number of words in each component, indexed by component ID
+        self.find_components()
 
     def add_graph(self, first_word, second_word):
         #Creating nodes and adding as neighbors
@@ -21,80 +46,650 @@ class Network:
 
     def make_neighbors_network(self):
         #Creating a network of all words that differ by only one letter
-        for word in self.words_list:
-            word_length = len(word)
-            for i in range(word_length):
-                for char in 'abcdefghijklmnopqrstuvwxyz':
-                    if char != word[i]:
-                        new_word = word[:i] + char + word[i + 1:]
-                        if new_word in self.nodes_dict:
-                            self.add_graph(word, new_word)
+        #Words in the same bucket differ only at the wildcard position, and two words
+        #can share at most one bucket, so each pair is linked exactly once
+        for bucket in make_buckets(self.nodes_dict):
+            for i in range(len(bucket)):
+                for j in range(i + 1, len(bucket)):
+                    self.add_graph(bucket[i], bucket[j])
+
+    def make_neighbors_network_numpy(self):
+        #Same network built from the vectorized neighbor arrays
+        nodes = list(self.nodes_dict.values())
+        offsets, neighbors = build_neighbor_arrays_numpy([node.word for node in nodes])
+        for i, node in enumerate(nodes):
+            node.neighbors = [nodes[j] for j in neighbors[offsets[i]:offsets[i + 1]]]
+
+    def find_components(self):
+        #BFS sweep giving every word the ID of its connected component
+        for node in self.nodes_dict.values():
+            if node.component is not None:
+                continue
+            component = len(self.component_sizes)
+            node.component = component
+            queue = deque([node])
+            size = 0
+            while queue:
+                current_node = queue.popleft()
+                size += 1
+                for neighbor in current_node.neighbors:
+                    if neighbor.component is None:
+                        neighbor.component = component
+                        queue.append(neighbor)
+            self.component_sizes.append(size)
+
+    def __contains__(self, word):
+        return word in self.nodes_dict
+
+    def neighbors(self, word):
+        #Returning the words one letter away from the given word
+        return [neighbor.word for neighbor in self.nodes_dict[word].neighbors]
+
+    def component_of(self, word):
+        node = self.nodes_dict.get(word)
+        return node.component if node else None
+
+def make_buckets(words):
+    #Grouping words by wildcard patterns, e.g. 'hat' goes into '*at', 'h*t' and 'ha*'
+    #Only buckets with two or more words can produce an edge
+    buckets = {}
+    for word in words:
+        for i in range(len(word)):
+            pattern = word[:i] + '*' + word[i + 1:]
+            if pattern in buckets:
+                buckets[pattern].append(word)
+            else:
+                buckets[pattern] = [word]
+    return [bucket for bucket in buckets.values() if len(bucket) > 1]
+
+def build_neighbor_arrays(words):
+    #Building the graph as offset and neighbor arrays over the indexes of a sorted word list
+    #The neighbors of words[i] are neighbors[offsets[i]:offsets[i + 1]]
+    index = {word: i for i, word in enumerate(words)}
+    adjacency = [[] for _ in words]
+    for bucket in make_buckets(words):
+        for i in range(len(bucket)):
+            for j in range(i + 1, len(bucket)):
+                first, second = index[bucket[i]], index[bucket[j]]
+                adjacency[first].append(second)
+                adjacency[second].append(first)
+
+    offsets = array('I', [0])
+    neighbors = array('I')
+    for row in adjacency:
+        row.sort()
+        neighbors.extend(row)
+        offsets.append(len(neighbors))
+    return offsets, neighbors
+
+def build_neighbor_arrays_numpy(words):
+    #Vectorized version of build_neighbor_arrays for words of one length, giving identical arrays
+    #The words form an N x L uint8 matrix. For each position that column is blanked, the rows are
+    #sorted, and rows with equal keys (one bucket) are paired without a Python loop over words
+    if np is None:
+        raise ImportError("The numpy backend needs numpy installed")
+    if isinstance(words, WordTable):
+        table, word_length = words.tobytes(), words.word_length
+    else:
+        table = ''.join(words).encode('ascii')
+        word_length = len(words[0]) if len(words) else 0
+    count = len(words)
+    if count * word_length != len(table):
+        raise ValueError("The numpy backend needs words of a single length")
+    if count == 0 or word_length == 0:
+        return array('I', [0] * (count + 1)), array('I')
+    letters = np.frombuffer(table, dtype=np.uint8).reshape(count, word_length)
+
+    firsts = []
+    seconds = []
+    for position in range(word_length):
+        keys = letters.copy()
+        keys[:, position] = 0
+        order = np.lexsort(keys.T[::-1])
+        ordered = keys[order]
+        #Bucket number of every row in sorted order
+        buckets = np.concatenate(([0], np.cumsum(np.any(ordered[1:] != ordered[:-1], axis=1))))
+        #Rows of a bucket are adjacent, so pairing each row with the one `gap` places later
+        #covers every pair, and the loop ends once no bucket is larger than `gap`
+        gap = 1
+        while gap < count:
+            same = buckets[gap:] == buckets[:-gap]
+            if not same.any():
+                break
+            firsts.append(order[:-gap][same])
+            seconds.append(order[gap:][same])
+            gap += 1
+
+    if firsts:
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        rows = np.concatenate((first, second))
+        columns = np.concatenate((second, first))
+        order = np.lexsort((columns, rows)) #Neighbors sorted by index, as in build_neighbor_arrays
+        rows, columns = rows[order], columns[order]
+    else:
+        rows = columns = np.zeros(0, dtype=np.int64)
+    counts = np.bincount(rows, minlength=count)
+    offsets = np.zeros(count + 1, dtype=np.uint32)
+    np.cumsum(counts, out=offsets[1:])
+
+    offset_array = array('I')
+    offset_array.frombytes(offsets.tobytes())
+    neighbor_array = array('I')
+    neighbor_array.frombytes(columns.astype(np.uint32).tobytes())
+    return offset_array, neighbor_array
+
+def neighbor_arrays(words, backend='auto'):
+    #Picking the numpy builder when it is available, 'python' or 'numpy' force one of them
+    if backend == 'numpy' or (backend == 'auto' and np is not None):
+        return build_neighbor_arrays_numpy(words)
+    return build_neighbor_arrays(words)
+
+def label_components(offsets, neighbors):
+    #BFS sweep over the neighbor arrays, returning the component ID of every word and the size of every component
+    count = len(offsets) - 1
+    unlabeled = 0xFFFFFFFF
+    components = array('I', [unlabeled]) * count
+    sizes = array('I')
+    for first in range(count):
+        if components[first] != unlabeled:
+            continue
+        component = len(sizes)
+        components[first] = component
+        queue = deque([first])
+        size = 0
+        while queue:
+            current = queue.popleft()
+            size += 1
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if components[neighbor] == unlabeled:
+                    components[neighbor] = component
+                    queue.append(neighbor)
+        sizes.append(size)
+    return components, sizes
+
+def component_stats(network):
+    #Summary of the component sizes of a Network or CompiledNetwork
+    sizes = network.component_sizes
+    return {
+        'components': len(sizes),
+        'largest': max(sizes, default=0),
+        'isolated_words': sum(1 for size in sizes if size == 1),
+        'largest_share': max(sizes, default=0) / max(sum(sizes), 1),
+    }
+
+# Compiled graph file layout: header, word table (fixed stride, sorted), offsets, neighbors,
+# component ID of every word, size of every component
+# The header records the size and modification time of the dictionary it was built from
+HEADER = struct.Struct('=4sIIIIIQQ')
+MAGIC = b'WLGR'
+VERSION = 2
+
+class WordTable:
+    #Read-only sorted sequence of fixed-length words packed back to back in a buffer
+    #Used both for dictionary partitions and for the word table of a compiled graph file
+    def __init__(self, buffer, start, count, word_length):
+        self.buffer = buffer
+        self.start = start
+        self.count = count
+        self.word_length = word_length
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        begin = self.start + i * self.word_length
+        return self.buffer[begin:begin + self.word_length].decode('ascii')
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def __contains__(self, word):
+        return len(word) == self.word_length and self.index(word) != -1
+
+    def index(self, word):
+        #Binary search, the words are sorted when the table is packed
+        i = bisect.bisect_left(self, word)
+        if i < self.count and self[i] == word:
+            return i
+        return -1
+
+    def tobytes(self):
+        return bytes(self.buffer[self.start:self.start + self.count * self.word_length])
+
+class CompiledNetwork:
+    #Word graph read from a compiled cache file through a memory map
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, word_length, count, edge_count, component_count, _, _ = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a compiled word graph: {}".format(path))
+        self.word_length = word_length
+        self.words = WordTable(self.buffer, HEADER.size, count, word_length)
+        #Arrays start on a 4 byte boundary after the word table
+        position = HEADER.size + _padded(count * word_length)
+        view = memoryview(self.buffer)
+        self.offsets = view[position:position + 4 * (count + 1)].cast('I')
+        position += 4 * (count + 1)
+        self.neighbor_array = view[position:position + 4 * edge_count].cast('I')
+        position += 4 * edge_count
+        self.components = view[position:position + 4 * count].cast('I')
+        position += 4 * count
+        self.component_sizes = view[position:position + 4 * component_count].cast('I')
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def neighbors(self, word):
+        i = self.words.index(word)
+        return [self.words[j] for j in self.neighbor_ids(i)]
+
+    def neighbor_ids(self, i):
+        #IDs of the neighbors of word i, read straight from the arrays without decoding any word
+        return self.neighbor_array[self.offsets[i]:self.offsets[i + 1]]
+
+    def component_of(self, word):
+        i = self.words.index(word) if len(word) == self.word_length else -1
+        return self.components[i] if i != -1 else None
+
+    def close(self):
+        for view in (self.offsets, self.neighbor_array, self.components, self.component_sizes):
+            view.release()
+        self.buffer.close()
+
+def _padded(size):
+    return (size + 3) & ~3
+
+def cache_path(word_length, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, 'words_{}.graph'.format(word_length))
+
+def dictionary_stamp(dictionary_path):
+    #The cache is rebuilt whenever the size or modification time of the dictionary changes
+    stat = os.stat(dictionary_path)
+    return stat.st_size, stat.st_mtime_ns
+
+def compile_graph(words, path, stamp):
+    #Writing a sorted word list and its neighbor arrays into a single file
+    if isinstance(words, WordTable):
+        table = words.tobytes() #Dictionary partitions are already sorted and packed
+        word_length = words.word_length
+    else:
+        words = sorted(set(words))
+        table = ''.join(words).encode('ascii')
+        word_length = len(words[0]) if words else 0
+    offsets, neighbors = neighbor_arrays(words)
+    components, component_sizes = label_components(offsets, neighbors)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, word_length, len(words), len(neighbors), len(component_sizes), *stamp))
+        file.write(table + b'\0' * (_padded(len(table)) - len(table)))
+        for values in (offsets, neighbors, components, component_sizes):
+            file.write(values.tobytes())
+    os.replace(temp_path, path) #Replacing in one step so readers never see a half written file
+
+def is_cache_fresh(path, stamp):
+    try:
+        with open(path, 'rb') as file:
+            header = file.read(HEADER.size)
+    except OSError:
+        return False
+    if len(header) != HEADER.size:
+        return False
+    magic, version, _, _, _, _, size, mtime = HEADER.unpack(header)
+    return magic == MAGIC and version == VERSION and (size, mtime) == stamp
+
+def load_dictionary(dictionary_path=DICTIONARY_FILE):
+    #Reading the dictionary once and splitting it into one packed WordTable per word length
+    packed = {}
+    with open(dictionary_path, 'rb') as file:
+        for line in file:
+            word = line.strip().lower()
+            if word:
+                if len(word) in packed:
+                    packed[len(word)] += word
+                else:
+                    packed[len(word)] = bytearray(word)
+
+    #Sorting one partition at a time so only that partition is ever held as separate objects
+    partitions = {}
+    for word_length in sorted(packed):
+        partitions[word_length] = pack_words(bytes(packed.pop(word_length)), word_length)
+    return partitions
+
+def pack_words(blob, word_length):
+    #Sorted, deduplicated WordTable from words of one length packed back to back
+    if not blob:
+        return WordTable(b'', 0, 0, word_length)
+    words = sorted(set(blob[i:i + word_length] for i in range(0, len(blob), word_length)))
+    return WordTable(b''.join(words), 0, len(words), word_length)
+
+def read_words(dictionary_path, word_length):
+    #Packed, sorted words of a single length, skipping every other length while reading
+    packed = bytearray()
+    with open(dictionary_path, 'rb') as file:
+        for line in file:
+            word = line.strip().lower()
+            if len(word) == word_length:
+                packed += word
+    return pack_words(bytes(packed), word_length)
+
+def precompile(dictionary_path=DICTIONARY_FILE, cache_dir=CACHE_DIR):
+    #Reading the dictionary once and writing a compiled graph for every word length
+    stamp = dictionary_stamp(dictionary_path)
+    partitions = load_dictionary(dictionary_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    for word_length, words in partitions.items():
+        compile_graph(words, cache_path(word_length, cache_dir), stamp)
+    return sorted(partitions)
+
+def load_network(word_length, dictionary_path=DICTIONARY_FILE, cache_dir=CACHE_DIR):
+    #Memory-mapping the compiled graph, compiling it first if it is missing or out of date
+    path = cache_path(word_length, cache_dir)
+    stamp = dictionary_stamp(dictionary_path)
+    if not is_cache_fresh(path, stamp):
+        os.makedirs(cache_dir, exist_ok=True)
+        compile_graph(read_words(dictionary_path, word_length), path, stamp)
+    return CompiledNetwork(path)
 
 def word_ladder(start_word, end_word, network):
+    #Bidirectional BFS, all search state lives in this call so one network can serve any number of queries
     if start_word == end_word:
         return [start_word] #Check to see if the two words are different
 
-    #Look for the corresponding object of the node in the dicitionary
-    start_node = network.nodes_dict.get(start_word)
-    if start_node is None:
+    if start_word not in network or end_word not in network:
         return "No path found" #Cases where no path is available
 
-    #Queueing and visitng the starting node 
-    queue = [start_node] 
-    start_node.visited = True
-
-    while queue:
-    #Taking first word from the queue
-        current_node = queue.pop(0)
-        #Checking if target word is found
-        if current_node.word == end_word:
-            path = [] #Initialzing a list to track path
-            #Tracing backthe path and adding to list
-            while current_node:
-                path.append(current_node.word)
-                current_node = current_node.parent
-            #Reversing path since it was traced backwards
-            return path[::-1]
-
-        for neighbor in current_node.neighbors:
-            #Checking each neighbors
-            if not neighbor.visited:
-                neighbor.visited = True  #Marking checked
-                neighbor.parent = current_node
-                queue.append(neighbor)  #Queueing to check
+    #Words in different components can never be joined, which the component index answers without a search
+    start_component = network.component_of(start_word)
+    if start_component is not None and start_component != network.component_of(end_word):
+        return "No path found"
+
+    if isinstance(network, CompiledNetwork):
+        #Searching over integer word IDs on the memory-mapped arrays, only the endpoints and the ladder are decoded
+        path = bidirectional_search(network.words.index(start_word), network.words.index(end_word),
+                                    network.neighbor_ids)
+        return [network.words[i] for i in path] if path else "No path found"
+
+    path = bidirectional_search(start_word, end_word, network.neighbors)
+    return path if path else "No path found"
+
+def bidirectional_search(start, end, neighbors):
+    #Each side maps the nodes it has reached to the node it came from, nodes are words or word IDs
+    forward_parents = {start: None}
+    backward_parents = {end: None}
+    forward_queue = deque([start])
+    backward_queue = deque([end])
+
+    while forward_queue and backward_queue:
+        #Expanding the smaller frontier keeps the number of visited words low
+        if len(forward_queue) <= len(backward_queue):
+            meeting_word = expand_level(forward_queue, forward_parents, backward_parents, neighbors)
+        else:
+            meeting_word = expand_level(backward_queue, backward_parents, forward_parents, neighbors)
+        if meeting_word is not None:
+            return join_path(meeting_word, forward_parents, backward_parents)
+
+    return None
+
+def expand_level(queue, parents, other_parents, neighbors):
+    #Visiting one whole BFS level, stopping at the first word the other side has already reached
+    for _ in range(len(queue)):
+        current_word = queue.popleft()
+        for neighbor in neighbors(current_word):
+            if neighbor not in parents:
+                parents[neighbor] = current_word
+                if neighbor in other_parents:
+                    return neighbor
+                queue.append(neighbor)
+    return None
+
+def join_path(meeting_word, forward_parents, backward_parents):
+    #Tracing back to the start word, then forward to the end word
+    path = []
+    current_word = meeting_word
+    while current_word is not None:
+        path.append(current_word)
+        current_word = forward_parents[current_word]
+    path.reverse() #Reversing path since it was traced backwards
+    current_word = backward_parents[meeting_word]
+    while current_word is not None:
+        path.append(current_word)
+        current_word = backward_parents[current_word]
+    return path
+
+def hamming_distance(first_word, second_word):
+    #Number of letter positions where the two words differ, a lower bound on the ladder length
+    return sum(1 for a, b in zip(first_word, second_word) if a != b)
+
+def shortest_ladders(start_word, end_word, network, k=1, max_expansions=None):
+    #A* search with the Hamming distance as heuristic, returning up to k distinct shortest ladders
+    #max_expansions caps the number of words taken off the heap so slow queries stay bounded
+    if start_word == end_word:
+        return [[start_word]]
+
+    if start_word not in network or end_word not in network:
+        return "No path found"
+
+    start_component = network.component_of(start_word)
+    if start_component is not None and start_component != network.component_of(end_word):
+        return "No path found"
+
+    #Every word keeps all of its parents on a shortest route so several ladders can be rebuilt
+    distance = {start_word: 0}
+    parents = {start_word: []}
+    closed = set()
+    #Heap entries are (estimated total, heuristic, counter, word), ties go to words closer to the target
+    counter = 0
+    heap = [(hamming_distance(start_word, end_word), hamming_distance(start_word, end_word), counter, start_word)]
+    expansions = 0
+    best = None
+
+    while heap:
+        estimate, _, _, current_word = heapq.heappop(heap)
+        if best is not None and estimate > best:
+            break #Every remaining word is on a longer route
+        if current_word in closed:
+            continue
+        if current_word == end_word:
+            best = distance[current_word]
+            if k == 1:
+                break
+            continue
+        if max_expansions is not None and expansions >= max_expansions:
+            if best is None:
+                return "Search budget exceeded"
+            break
+        closed.add(current_word)
+        expansions += 1
+
+        next_distance = distance[current_word] + 1
+        for neighbor in network.neighbors(current_word):
+            known = distance.get(neighbor)
+            if known is None or next_distance < known:
+                distance[neighbor] = next_distance
+                parents[neighbor] = [current_word]
+                counter += 1
+                heuristic = hamming_distance(neighbor, end_word)
+                heapq.heappush(heap, (next_distance + heuristic, heuristic, counter, neighbor))
+            elif next_distance == known:
+                parents[neighbor].append(current_word) #Another route of the same length
+
+    if best is None:
+        return "No path found"
+    return collect_ladders(start_word, end_word, parents, k)
+
+def collect_ladders(start_word, end_word, parents, k):
+    #Walking the parent lists back from the end word with an explicit stack, stopping after k ladders
+    ladders = []
+    stack = [(end_word, [end_word])]
+    while stack and len(ladders) < k:
+        current_word, path = stack.pop()
+        if current_word == start_word:
+            ladders.append(path[::-1])
+            continue
+        for parent in reversed(parents[current_word]):
+            stack.append((parent, path + [parent]))
+    return ladders
+
+def word_ladder_astar(start_word, end_word, network, max_expansions=None):
+    ladders = shortest_ladders(start_word, end_word, network, 1, max_expansions)
+    if isinstance(ladders, str):
+        return ladders
+    return ladders[0]
+
 #YuDong's part
 #Creating a list of all words that differ by only one letter from the target word
 def find_neighbors(word, words_set):
     neighbors = []
     for i in range(len(word)):
-        for char in 'abcdefghijklmnopqrstuvwxyz':
+        for char in ALPHABET:
             if char != word[i]:
                 new_word = word[:i] + char + word[i+1:]
                 if new_word in words_set:
                     neighbors.append(new_word)
     return neighbors
 
-#Taking input and converting to lowercase
-start_word = input("Enter the start word: ").lower()
-end_word = input("Enter the end word: ").lower()
+class ImplicitNetwork:
+    #Word graph whose edges are generated on demand with find_neighbors
+    #Only the words the search actually expands get a neighbor list, so memory follows the search frontier
+    def __init__(self, words_list):
+        self.words_set = set(words_list)
+        self.neighbors_cache = {}
+
+    def __contains__(self, word):
+        return word in self.words_set
+
+    def component_of(self, word):
+        return None #Components are unknown without building the whole graph
+
+    def neighbors(self, word):
+        neighbors = self.neighbors_cache.get(word)
+        if neighbors is None:
+            neighbors = find_neighbors(word, self.words_set)
+            self.neighbors_cache[word] = neighbors
+        return neighbors
+
+#Batch solving
+#Networks already opened by this process, keyed by word length, so each worker loads a length once
+worker_networks = {}
+
+def read_pairs(pairs_path):
+    #Yielding (line number, start word, end word) for every non-empty line of 'start end' or 'start,end'
+    #Malformed lines yield (line number, None, None) so they show up as errors in the results
+    with open(pairs_path, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            fields = line.replace(',', ' ').split()
+            if len(fields) == 2:
+                yield line_number, fields[0].lower(), fields[1].lower()
+            elif fields:
+                yield line_number, None, None
+
+def ladder_result(line_number, start_word, end_word, ladder):
+    if isinstance(ladder, list):
+        return {'line': line_number, 'start': start_word, 'end': end_word, 'ladder': ladder}
+    return {'line': line_number, 'start': start_word, 'end': end_word, 'ladder': None, 'error': ladder}
+
+def solve_chunk(dictionary_path, cache_dir, word_length, pairs):
+    #Runs in a worker process, solving pairs that all have the same word length
+    network = worker_networks.get(word_length)
+    if network is None:
+        network = load_network(word_length, dictionary_path, cache_dir)
+        worker_networks[word_length] = network
+    return [ladder_result(line_number, start_word, end_word, word_ladder(start_word, end_word, network))
+            for line_number, start_word, end_word in pairs]
+
+def solve_batch(pairs, dictionary_path=DICTIONARY_FILE, cache_dir=CACHE_DIR, workers=None, chunk_size=500):
+    #Grouping the pairs by word length and solving the groups across a process pool
+    #Results are yielded as soon as each chunk finishes, so their order follows completion, not input
+    groups = {}
+    for line_number, start_word, end_word in pairs:
+        if start_word is None:
+            yield {'line': line_number, 'error': "Expected two words"}
+        elif len(start_word) != len(end_word):
+            yield ladder_result(line_number, start_word, end_word, "Start and end words must be of the same length")
+        else:
+            groups.setdefault(len(start_word), []).append((line_number, start_word, end_word))
+
+    #Compiling missing graphs up front so workers never compile the same length at once
+    #One dictionary pass serves every stale length
+    stamp = dictionary_stamp(dictionary_path)
+    stale = [word_length for word_length in groups if not is_cache_fresh(cache_path(word_length, cache_dir), stamp)]
+    if stale:
+        partitions = load_dictionary(dictionary_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        for word_length in stale:
+            words = partitions.get(word_length) or WordTable(b'', 0, 0, word_length)
+            compile_graph(words, cache_path(word_length, cache_dir), stamp)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for word_length, group in groups.items():
+            for i in range(0, len(group), chunk_size):
+                futures.append(executor.submit(solve_chunk, dictionary_path, cache_dir, word_length,
+                                               group[i:i + chunk_size]))
+        for future in as_completed(futures):
+            for result in future.result():
+                yield result
+
+def main():
+    parser = argparse.ArgumentParser(description="Find a word ladder between two words of the same length.")
+    parser.add_argument('--dictionary', default=DICTIONARY_FILE, help="word list, one word per line")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="directory for the compiled graphs")
+    parser.add_argument('--precompile', action='store_true', help="compile the graphs for every word length and exit")
+    parser.add_argument('--lazy', action='store_true', help="generate neighbors during the search instead of loading a graph")
+    parser.add_argument('--astar', action='store_true', help="use A* search instead of bidirectional BFS")
+    parser.add_argument('--ladders', type=int, default=1, help="number of distinct shortest ladders to list (A* only)")
+    parser.add_argument('--max-expansions', type=int, default=None, help="stop the A* search after this many words")
+    parser.add_argument('--batch', metavar='PAIRS', help="solve every 'start end' line of this file and write JSONL")
+    parser.add_argument('--output', help="JSONL file for --batch results (default: standard output)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes for --batch (default: CPU count)")
+    args = parser.parse_args()
+
+    if args.precompile:
+        lengths = precompile(args.dictionary, args.cache_dir)
+        print("Compiled word graphs for lengths:", lengths)
+        return
+
+    if args.batch:
+        output = open(args.output, 'w') if args.output else sys.stdout
+        try:
+            for result in solve_batch(read_pairs(args.batch), args.dictionary, args.cache_dir, args.workers):
+                output.write(json.dumps(result) + '\n')
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        return
+
+    #Taking input and converting to lowercase
+    start_word = input("Enter the start word: ").lower()
+    end_word = input("Enter the end word: ").lower()
 
-if len(start_word) != len(end_word):
-    print("Error: Start and end words must be of the same length.") #Ensuring both words are of the same length
-else:
-    words_list = []
-    with open('words_alpha.txt', 'r') as file:
-        for word in file:
-            word = word.strip().lower()
-            if len(word) == len(start_word):
-                words_list.append(word)
+    if len(start_word) != len(end_word):
+        print("Error: Start and end words must be of the same length.") #Ensuring both words are of the same length
+        return
 
-    network = Network(words_list)
+    if args.lazy:
+        network = ImplicitNetwork(read_words(args.dictionary, len(start_word)))
+    else:
+        network = load_network(len(start_word), args.dictionary, args.cache_dir)
 
     #Measuring runtime
     start_time = time.time()
-    ladder = word_ladder(start_word, end_word, network)
+    if args.astar and args.ladders > 1:
+        ladder = shortest_ladders(start_word, end_word, network, args.ladders, args.max_expansions)
+    elif args.astar:
+        ladder = word_ladder_astar(start_word, end_word, network, args.max_expansions)
+    else:
+        ladder = word_ladder(start_word, end_word, network)
     end_time = time.time()
 
     print("Word ladder from '{}' to '{}':".format(start_word, end_word), ladder)
     print("Runtime of the word_ladder function: {:.6f} seconds".format(end_time - start_time))
 
+if __name__ == '__main__':
+    main()
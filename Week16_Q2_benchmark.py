@@ -0,0 +1,157 @@
+import argparse
+import cProfile
+import json
+import pstats
+import random
+import tempfile
+import time
+import tracemalloc
+
+import Week16_Q2 as ladder
+
+#Graph builders being compared, each takes a packed length partition and returns something word_ladder can search
+BUILDERS = {
+    'network': lambda words, cache_dir: ladder.Network(words),
+    'network-numpy': lambda words, cache_dir: ladder.Network(words, backend='numpy'),
+    'implicit': lambda words, cache_dir: ladder.ImplicitNetwork(words),
+    'compiled': lambda words, cache_dir: compile_and_load(words, cache_dir),
+}
+
+SEARCHES = {
+    'bfs': ladder.word_ladder,
+    'astar': ladder.word_ladder_astar,
+}
+
+def compile_and_load(words, cache_dir):
+    path = ladder.cache_path(words.word_length, cache_dir)
+    ladder.compile_graph(words, path, (0, 0))
+    return ladder.CompiledNetwork(path)
+
+def close_network(network):
+    #Compiled networks hold a memory map that has to be released before the cache directory is removed
+    if hasattr(network, 'close'):
+        network.close()
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def query_pairs(words, count, seed):
+    #Fixed, seeded set of (start, end) pairs so runs can be compared with each other
+    rng = random.Random(seed)
+    return [(rng.choice(words), rng.choice(words)) for _ in range(count)]
+
+def measure_peak_memory(function):
+    #Peak bytes allocated by Python while the function runs, also when --tracemalloc is already tracing
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak - before
+
+def benchmark_length(words, builder, search, queries, seed, cache_dir):
+    build = BUILDERS[builder]
+
+    #Timing and memory are measured in separate builds because tracemalloc slows allocation down. The memory
+    #build is closed first, so the compiled builder never replaces a cache file that is still memory-mapped
+    measured_network, peak_memory = measure_peak_memory(lambda: build(words, cache_dir))
+    close_network(measured_network)
+    start_time = time.perf_counter()
+    network = build(words, cache_dir)
+    build_time = time.perf_counter() - start_time
+
+    latencies = []
+    found = 0
+    for start_word, end_word in query_pairs(words, queries, seed):
+        start_time = time.perf_counter()
+        result = SEARCHES[search](start_word, end_word, network)
+        latencies.append(time.perf_counter() - start_time)
+        if isinstance(result, list):
+            found += 1
+    close_network(network)
+    latencies.sort()
+    return {
+        'length': words.word_length,
+        'words': len(words),
+        'build_s': build_time,
+        'peak_memory_mb': peak_memory / 2 ** 20,
+        'queries': len(latencies),
+        'found': found,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+def run(args, cache_dir):
+    start_time = time.perf_counter()
+    partitions = ladder.load_dictionary(args.dictionary)
+    load_time = time.perf_counter() - start_time
+
+    rows = []
+    for word_length in args.lengths:
+        words = partitions.get(word_length)
+        if not words:
+            continue
+        row = benchmark_length(words, args.builder, args.search, args.queries, args.seed, cache_dir)
+        #The dictionary is read in one pass for every length, so each row reports that shared cost
+        row['load_s'] = load_time
+        rows.append(row)
+    return rows
+
+def print_rows(rows):
+    columns = ['length', 'words', 'load_s', 'build_s', 'peak_memory_mb', 'queries', 'found', 'p50_ms', 'p99_ms']
+    print(' '.join('{:>14}'.format(column) for column in columns))
+    for row in rows:
+        print(' '.join('{:>14.4f}'.format(row[column]) if isinstance(row[column], float)
+                       else '{:>14}'.format(row[column]) for column in columns))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading, building and searching the word ladder graph.")
+    parser.add_argument('--dictionary', default=ladder.DICTIONARY_FILE, help="word list, one word per line")
+    parser.add_argument('--lengths', type=int, nargs='+', default=[3, 4, 5, 6, 7, 8], help="word lengths to measure")
+    parser.add_argument('--builder', choices=sorted(BUILDERS), default='network', help="graph representation to build")
+    parser.add_argument('--search', choices=sorted(SEARCHES), default='bfs', help="ladder search to time")
+    parser.add_argument('--queries', type=int, default=1000, help="query pairs per word length")
+    parser.add_argument('--seed', type=int, default=0, help="seed for choosing the query pairs")
+    parser.add_argument('--json', action='store_true', help="print one JSON object per length instead of a table")
+    parser.add_argument('--profile', metavar='FILE', help="run under cProfile and save the stats to this file")
+    parser.add_argument('--tracemalloc', action='store_true', help="print the top allocation sites of the whole run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if args.tracemalloc:
+            tracemalloc.start(25)
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler:
+            profiler.enable()
+        rows = run(args, cache_dir)
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        if args.tracemalloc:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+    if args.json:
+        for row in rows:
+            print(json.dumps(row))
+    else:
+        print_rows(rows)
+
+    if profiler:
+        pstats.Stats(args.profile).sort_stats('cumulative').print_stats(20)
+    if args.tracemalloc:
+        print("Top allocation sites:")
+        for statistic in snapshot.statistics('lineno')[:15]:
+            print(statistic)
+
+if __name__ == '__main__':
+    main()
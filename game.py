@@ -1,30 +1,101 @@
+import argparse
 import pygame
 import random
+import time
+import tracemalloc
+from collections import deque
 
 
 pygame.init()
-
-
-class Stack:
-    def __init__(self):
-        self.items = []
-
-    def is_empty(self):
-        return len(self.items) == 0
-
-    def push(self, item):
-        self.items.append(item)
-
-    def pop(self):
-        if not self.is_empty():
-            return self.items.pop()
-
-    def peek(self):
-        if not self.is_empty():
-            return self.items[-1]
-
-    def size(self):
-        return len(self.items)
+SCREEN_SIZE = (640, 480)  # Size of the game window, also used for the pre-rendered room backgrounds
+FPS = 60  # Frame rate cap of every screen
+UPDATES_PER_SECOND = 60  # Fixed rate of the game logic, so movement speed does not depend on the machine
+FRAME_LOG_INTERVAL = 0  # Seconds between frame time reports printed to the console, 0 turns them off
+MAZE_SIZE = 7  # Number of rooms in a maze
+
+
+class FrameLoop:
+    """Shared loop driver for every screen. It caps the frame rate with pygame.time.Clock, runs the game logic at
+        a fixed timestep independent of rendering, and keeps frame time statistics (mean, p99, dropped frames)
+        that can be shown as an overlay (toggled with F3) or printed to the console."""
+
+    show_stats = False  # Shared by every screen, so the overlay stays on when the screen changes
+
+    def __init__(self, fps=FPS, updates_per_second=UPDATES_PER_SECOND, log_interval=FRAME_LOG_INTERVAL):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.step = 1000 / updates_per_second  # Milliseconds of game time per logic update
+        self.max_updates = 5  # Logic updates per frame before the loop gives up catching up
+        self.frame_times = deque(maxlen=300)  # Milliseconds of the most recent frames
+        self.frames = 0
+        self.dropped_frames = 0  # Frames that took more than 1.5 times the target frame time
+        self.log_interval = log_interval * 1000
+        self.since_log = 0
+        self.font = pygame.font.Font(None, 20)
+        self.stats_rect = None  # Screen area of the overlay in the previous frame
+
+    def resume(self):  # Method which restarts timing after another screen had control, so the pause is not counted
+        self.clock.tick()
+
+    def record(self, frame_time):
+        self.frames += 1
+        self.frame_times.append(frame_time)
+        if frame_time > 1.5 * 1000 / self.fps:
+            self.dropped_frames += 1
+        if self.log_interval:
+            self.since_log += frame_time
+            if self.since_log >= self.log_interval:
+                self.since_log = 0
+                print(self.stats_text())
+
+    def stats(self):  # Mean and 99th percentile frame time in milliseconds over the recent frames
+        if not self.frame_times:
+            return 0.0, 0.0
+        ordered = sorted(self.frame_times)
+        return sum(ordered) / len(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+    def stats_text(self):
+        mean, p99 = self.stats()
+        return f'frame {mean:.1f} ms  p99 {p99:.1f} ms  dropped {self.dropped_frames}/{self.frames}'
+
+    def draw_stats(self, screen, background=None):  # Method which draws the overlay, returning the changed area
+        if not self.show_stats:
+            return None
+        text = self.font.render(self.stats_text(), True, (255, 255, 0))
+        rect = text.get_rect(topleft=(5, 5))
+        changed = rect.union(self.stats_rect) if self.stats_rect else rect
+        if background is None:
+            screen.fill((0, 0, 0), changed)
+        else:
+            screen.blit(background, changed, changed)  # Erase the previous overlay
+        screen.blit(text, rect)
+        self.stats_rect = rect
+        return changed
+
+    def run(self, is_running, handle_event, update, render):
+        # Each frame: wait for the frame cap, handle events, catch the logic up in fixed steps, then render once
+        self.resume()
+        lag = 0
+        while True:
+            frame_time = self.clock.tick(self.fps)
+            self.record(frame_time)
+            for event in pygame.event.get():
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    FrameLoop.show_stats = not FrameLoop.show_stats
+                handle_event(event)
+            if not is_running():
+                return
+            lag += frame_time
+            updates = 0
+            while lag >= self.step and updates < self.max_updates and is_running():
+                update()
+                lag -= self.step
+                updates += 1
+            if updates == self.max_updates:
+                lag = 0  # Too far behind, skip the missing updates instead of spiralling
+            if not is_running():
+                return
+            render()
 
 
 class Point:
@@ -40,6 +111,7 @@ class Point:
 
 class Wall:
     """Represents an immovable wall in the game. Walls define the boundaries and obstacles in rooms."""
+    __slots__ = ('figure', 'colour')
 
     def __init__(self, x, y, width, height):  # Initialize attributes.
         self.figure = pygame.Rect(x, y, width, height)  # The rectangular area the wall occupies.
@@ -48,6 +120,7 @@ class Wall:
 
 class Door:
     """Represents a door in the game, allowing the character to move between rooms."""
+    __slots__ = ('figure', 'colour', 'direction')
 
     def __init__(self, x, y, width, height, direction):  # Initialize attributes.
         self.figure = pygame.Rect(x, y, width, height)  # The rectangular area the door occupies.
@@ -57,173 +130,226 @@ class Door:
             self.colour = (0, 255, 0)  # If it is exit door color is red.
 
 
+class RoomLayout:
+    """The walls and doors of one type of room, shared by every room of that type. A layout is never changed
+      once it is built, so one instance and one pre-rendered background serve any number of rooms."""
+    __slots__ = ('objects', 'walls', 'doors', 'wall_rects', 'background')
+
+    def __init__(self, objects):
+        self.objects = tuple(objects)
+        self.walls = tuple(obj for obj in self.objects if isinstance(obj, Wall))
+        self.doors = tuple(obj for obj in self.objects if isinstance(obj, Door))
+        self.wall_rects = tuple(wall.figure for wall in self.walls)  # Wall rectangles for Rect.collidelist
+        self.background = None  # Surface with every wall and door already drawn
+
+    def draw_background(self):  # Method which draws the static background the first time it is needed
+        if self.background is not None:
+            return
+        self.background = pygame.Surface(SCREEN_SIZE)
+        self.background.fill((0, 0, 0))
+        for obj in self.objects:
+            pygame.draw.rect(self.background, obj.colour, obj.figure)
+
+
+# Walls and doors of the four room types, depending on which of the left and right rooms exist
+ROOM_TEMPLATES = {
+    'both': (Wall(210, 0, 10, 160), Wall(420, 0, 10, 160), Wall(210, 320, 10, 160), Wall(420, 320, 10, 160),
+             Wall(0, 150, 210, 10), Wall(430, 150, 210, 10), Wall(0, 150, 10, 330), Wall(630, 150, 10, 330),
+             Wall(220, 320, 200, 10), Wall(220, 0, 200, 10), Wall(10, 470, 200, 10), Wall(430, 470, 200, 10),
+             Door(70, 460, 80, 10, 'left'), Door(490, 460, 80, 10, 'right')),
+    'left': (Wall(210, 0, 10, 640), Wall(420, 0, 10, 640), Wall(220, 0, 200, 10), Wall(220, 470, 200, 10),
+             Door(280, 460, 80, 10, 'left')),
+    'right': (Wall(210, 0, 10, 640), Wall(420, 0, 10, 640), Wall(220, 0, 200, 10), Wall(220, 470, 200, 10),
+              Door(280, 460, 80, 10, 'right')),
+    'leaf': (Wall(210, 0, 10, 640), Wall(420, 0, 10, 640), Wall(220, 0, 200, 10), Wall(220, 470, 200, 10)),
+}
+BACK_DOOR = Door(280, 10, 80, 10, 'back')
+EXIT_DOOR = Door(280, 460, 80, 10, 'exit')
+room_layouts = {}  # (room type, has back door, is exit) -> RoomLayout, at most a handful for any maze size
+
+
+def room_layout(room_type, has_back, is_exit):
+    key = (room_type, has_back, is_exit)
+    layout = room_layouts.get(key)
+    if layout is None:
+        objects = list(ROOM_TEMPLATES[room_type])
+        if has_back:
+            objects.append(BACK_DOOR)
+        if is_exit:
+            objects.append(EXIT_DOOR)
+        layout = room_layouts[key] = RoomLayout(objects)
+    return layout
+
+
 class Room:
     _id_counter = 0
     """This class represents a room within a maze. Each room is essentially a node in a graph structure, with
-      potential connections in three directions: back, left, right or exit."""
+      potential connections in three directions: back, left, right or exit. Its walls and doors come from a
+      RoomLayout shared with every room of the same type, picked when the room is first entered."""
+    __slots__ = ('id', 'adjacent_rooms', 'visited', 'is_exit', 'spawn', 'layout', 'distance_to_exit', 'next_hop')
 
     def __init__(self, back=None):
         self.id = Room._id_counter
         Room._id_counter += 1
-<<<<<<< Updated upstream
-        self.back_way = back_way  # Room from which this room was entered, if any (parent node)
-        self.right_way = None  # Room that will be to the right of this room (right node)
-        self.left_way = None  # Room that will be to the left of this room (left node)
-        self.visited = False  # Status which shows if room was visited
-        self.is_exit = False
-        self.room_objects = []  # All objects of room, will be described in make_objects method
-        self.spawn = (320, 25)  # The spawn coordinates are used when we visit a room several times
-
-    def make_room_objects(self):  # Method which make doors and walls for this room.
-        if self.left_way and self.right_way:
-            self.room_objects.extend([Wall(210, 0, 10, 160), Wall(420, 0, 10, 160), Wall(210, 320, 10, 160),
-                                      Wall(420, 320, 10, 160), Wall(0, 150, 210, 10), Wall(430, 150, 210, 10),
-                                      Wall(0, 150, 10, 330), Wall(630, 150, 10, 330), Wall(220, 320, 200, 10),
-                                      Wall(220, 0, 200, 10), Wall(10, 470, 200, 10), Wall(430, 470, 200, 10),
-                                      Door(70, 460, 80, 10, 'left'), Door(490, 460, 80, 10, 'right')])
-        elif self.left_way:
-            self.room_objects.extend([Wall(210, 0, 10, 160), Wall(420, 0, 10, 320), Wall(220, 0, 200, 10),
-                                      Wall(220, 320, 210, 10), Wall(210, 320, 10, 160), Wall(0, 150, 210, 10),
-                                      Wall(0, 150, 10, 330), Wall(10, 470, 200, 10), Door(70, 460, 80, 10, 'left')])
-        elif self.right_way:
-            self.room_objects.extend([Wall(210, 0, 10, 330), Wall(420, 0, 10, 160), Wall(220, 0, 200, 10),
-                                      Wall(220, 320, 200, 10), Wall(420, 320, 10, 160), Wall(430, 150, 210, 10),
-                                      Wall(630, 150, 10, 330), Wall(430, 470, 200, 10),
-                                      Door(490, 460, 80, 10, 'right')])
-        else:
-            self.room_objects.extend([Wall(210, 0, 10, 330), Wall(420, 0, 10, 330), Wall(220, 0, 200, 10),
-                                      Wall(220, 320, 200, 10)])
-        if self.back_way:
-            self.room_objects.append(Door(280, 10, 80, 10, 'back'))
-        else:
-            self.visited = True
-=======
         self.adjacent_rooms = {'back': back, 'right': None, 'left': None}
         self.visited = False
-        self.objects = []
+        self.is_exit = False
         self.spawn = (320, 30)
->>>>>>> Stashed changes
+        self.layout = None
+        self.distance_to_exit = None  # Rooms between this room and the exit, filled in by the maze
+        self.next_hop = None  # Door ('back', 'left' or 'right') leading one room closer to the exit
+
+    @property
+    def objects(self):
+        return self.layout.objects
+
+    @property
+    def walls(self):
+        return self.layout.walls
+
+    @property
+    def doors(self):
+        return self.layout.doors
+
+    @property
+    def wall_rects(self):
+        return self.layout.wall_rects
+
+    @property
+    def background(self):
+        return self.layout.background
+
+    def room_type(self):
+        if self.adjacent_rooms['left'] and self.adjacent_rooms['right']:
+            return 'both'
+        if self.adjacent_rooms['left']:
+            return 'left'
+        if self.adjacent_rooms['right']:
+            return 'right'
+        return 'leaf'
+
+    def make_objects(self):  # Method which picks the shared layout holding the walls and doors of this room
+        if self.layout is None:
+            self.layout = room_layout(self.room_type(), self.adjacent_rooms['back'] is not None, self.is_exit)
+
+    def prepare(self):  # Method which picks the layout and makes sure its background is drawn
+        self.make_objects()
+        self.layout.draw_background()
 
 
 class Maze:
-    def __init__(self, size):
+    def __init__(self, size, seed=None):
+        start_time = time.perf_counter()
         self.size = size
+        self.random = random.Random(seed)  # Same seed, same maze
         self.rooms = []
         self.start_room = self.generate_random_maze(self.size)
-<<<<<<< Updated upstream
         self.leaf_rooms = []
-        self.find_leaf_rooms(self.start_room)
-        if self.leaf_rooms:
-            self.exit_room = random.choice(self.leaf_rooms)
-            self.exit_room.room_objects.append(Door(280, 310, 80, 10, 'exit'))
-            self.exit_room.is_exit = True
-        self.steps_to_exit = self.dijkstra_shortest_path()
-=======
         self.find_leaf_rooms(self.start_room)
         self.exit_room = self.find_exit_room()
-        self.make_objects()
-        self.shortest_distance = self.dfs()
->>>>>>> Stashed changes
+        self.find_exit_distances()
+        self.shortest_distance = self.start_room.distance_to_exit
+        self.generation_time = time.perf_counter() - start_time  # Seconds spent building the maze
 
-    def generate_random_maze(self, size, back_way=None):
+    def generate_random_maze(self, size):
+        # Iterative, so the maze size is not limited by the recursion limit. Each room splits the rooms still
+        # to be placed below it randomly between its left and right subtrees
         if size == 0:
             return None
-        left_size = random.randint(0, size - 1)
-        right_size = size - 1 - left_size
-        room = Room(back_way)
-        room.adjacent_rooms['left'] = self.generate_random_maze(left_size, room)
-        room.adjacent_rooms['right'] = self.generate_random_maze(right_size, room)
-        self.rooms.append(room)
-        return room
+        start_room = Room()
+        start_room.visited = True  # The player starts here, so it never has a mini game
+        self.rooms.append(start_room)
+        pending = [(start_room, size)]
+        while pending:
+            room, room_size = pending.pop()
+            left_size = int(self.random.random() * room_size)  # Same as randint(0, room_size - 1), but faster
+            right_size = room_size - 1 - left_size
+            for direction, subtree_size in (('left', left_size), ('right', right_size)):
+                if subtree_size:
+                    child = Room(room)
+                    room.adjacent_rooms[direction] = child
+                    self.rooms.append(child)
+                    pending.append((child, subtree_size))
+        return start_room
 
     def find_leaf_rooms(self, room):
-        if room is not None:
+        stack = [room] if room is not None else []
+        while stack:
+            room = stack.pop()
             if not room.adjacent_rooms['right'] and not room.adjacent_rooms['left']:
                 self.leaf_rooms.append(room)
             if room.adjacent_rooms['left']:
-                self.find_leaf_rooms(room.adjacent_rooms['left'])
+                stack.append(room.adjacent_rooms['left'])
             if room.adjacent_rooms['right']:
-                self.find_leaf_rooms(room.adjacent_rooms['right'])
-
-<<<<<<< Updated upstream
-    def dijkstra_shortest_path(self):
-        # Dictionary to store the minimum cost to reach each room from the start room
-        min_cost = {room: float('inf') for room in self.rooms}
-        min_cost[self.start_room] = 0
-
-        # Priority queue to explore the room with the smallest distance first
-        priority_queue = [(0, self.start_room.id, self.start_room)]
-
-        while priority_queue:
-            current_cost, _, current_room = heapq.heappop(priority_queue)
-
-            # Explore the neighbor rooms if a cheaper path to them is found
-            for direction in ['left_way', 'right_way', 'back_way']:
-                neighbor = getattr(current_room, direction)
-                if neighbor is not None and min_cost[current_room] + 1 < min_cost[neighbor]:
-                    min_cost[neighbor] = min_cost[current_room] + 1
-                    heapq.heappush(priority_queue, (min_cost[neighbor], neighbor.id, neighbor))
-
-        # The cost to reach the exit room
-        return min_cost[self.exit_room]
-=======
+                stack.append(room.adjacent_rooms['right'])
+
     def find_exit_room(self):
-        exit_room = random.choice(self.leaf_rooms)
-        exit_room.objects.append(Door(280, 460, 80, 10, 'exit'))
+        exit_room = self.random.choice(self.leaf_rooms)
+        exit_room.is_exit = True  # Gives the room a layout with the exit door
         return exit_room
 
-    def dfs(self):
-        stack = Stack()
-        stack.push((self.start_room, 0))
-        visited = set()
-        while not stack.is_empty():
-            current_room, current_path_length = stack.pop()
-            if current_room in visited:
-                continue
-            visited.add(current_room)
-            if current_room == self.exit_room:
-                return current_path_length
-            for neighbor in current_room.adjacent_rooms.values():
-                if neighbor is not None and neighbor not in visited:
-                    stack.push((neighbor, current_path_length + 1))
-
-    def make_objects(self):
-        for room in self.rooms:
-            if room.adjacent_rooms['left'] and room.adjacent_rooms['right']:
-                room.objects.extend([Wall(210, 0, 10, 160), Wall(420, 0, 10, 160), Wall(210, 320, 10, 160),
-                                     Wall(420, 320, 10, 160), Wall(0, 150, 210, 10), Wall(430, 150, 210, 10),
-                                     Wall(0, 150, 10, 330), Wall(630, 150, 10, 330), Wall(220, 320, 200, 10),
-                                     Wall(220, 0, 200, 10), Wall(10, 470, 200, 10), Wall(430, 470, 200, 10),
-                                     Door(70, 460, 80, 10, 'left'), Door(490, 460, 80, 10, 'right')])
-            elif room.adjacent_rooms['left']:
-                room.objects.extend([Wall(210, 0, 10, 640), Wall(420, 0, 10, 640), Wall(220, 0, 200, 10),
-                                     Wall(220, 470, 200, 10), Door(280, 460, 80, 10, 'left')])
-            elif room.adjacent_rooms['right']:
-                room.objects.extend([Wall(210, 0, 10, 640), Wall(420, 0, 10, 640), Wall(220, 0, 200, 10),
-                                     Wall(220, 470, 200, 10), Door(280, 460, 80, 10, 'right')])
-            else:
-                room.objects.extend([Wall(210, 0, 10, 640), Wall(420, 0, 10, 640), Wall(220, 0, 200, 10),
-                                     Wall(220, 470, 200, 10)])
-            if room.adjacent_rooms['back']:
-                room.objects.append(Door(280, 10, 80, 10, 'back'))
-            else:
-                room.visited = True
->>>>>>> Stashed changes
+    def find_exit_distances(self):
+        # One breadth first search from the exit gives every room its distance to the exit and the door that leads
+        # one room closer, so the game never has to search the maze again
+        self.exit_room.distance_to_exit = 0
+        queue = deque([self.exit_room])
+        while queue:
+            room = queue.popleft()
+            for direction, neighbor in room.adjacent_rooms.items():
+                if neighbor is None or neighbor.distance_to_exit is not None:
+                    continue
+                neighbor.distance_to_exit = room.distance_to_exit + 1
+                if direction != 'back':
+                    neighbor.next_hop = 'back'
+                elif neighbor.adjacent_rooms['left'] is room:
+                    neighbor.next_hop = 'left'
+                else:
+                    neighbor.next_hop = 'right'
+                queue.append(neighbor)
+
+
+def maze_generation_report(size, seed=None):
+    # Generation time and peak Python memory of one maze. The maze is built twice, because tracemalloc slows
+    # allocation down and would distort the timing
+    maze = Maze(size, seed)
+    tracemalloc.start()
+    try:
+        Maze(size, seed)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'rooms': len(maze.rooms), 'seconds': maze.generation_time, 'peak_memory_mb': peak / 2 ** 20,
+            'leaf_rooms': len(maze.leaf_rooms), 'shortest_distance': maze.shortest_distance}
 
 
 class Game:
     """Main game class that encapsulates the game state and logic. It manages the game loop, character movements,
         collision detection, and rendering of game elements to the screen."""
 
-    def __init__(self):  # initialize all attributes (features) of game
+    def __init__(self, maze_size=MAZE_SIZE, seed=None):  # initialize all attributes (features) of game
         self.point = Point(5, 5)  # Initialize the character with specified radius and speed.
-        self.screen = pygame.display.set_mode((640, 480))  # Set the size of the game window.
+        self.screen = pygame.display.set_mode(SCREEN_SIZE)  # Set the size of the game window.
         self.steps = 0
-        self.maze = Maze(7)
-        self.current_room = self.maze.start_room  # Start the character in the initial room of the maze.
-        self.room_objects = self.current_room.room_objects  # All current objects that will be interacted with.
+        self.maze_size = maze_size
+        self.maze_seeds = random.Random(seed)  # Gives every new maze its seed, so a seeded game is reproducible
+        self.maze = Maze(self.maze_size, self.maze_seeds.random())
+        self.full_redraw = True  # Set whenever the whole screen has to be drawn again
+        self.last_point_rect = None  # Screen area the point covered in the previous frame
+        self.enter_room(self.maze.start_room)  # Start the character in the initial room of the maze.
         self.mini_game = MiniGame(self.screen)
+        self.frame_loop = FrameLoop()
         self.running = True
+        self.show_hint = False  # Toggled with H, shows which door leads towards the exit
+        self.hint_font = pygame.font.Font(None, 20)
+
+    def enter_room(self, room):  # Method which makes a room current, preparing it the first time
+        room.prepare()
+        self.current_room = room
+        self.full_redraw = True
+
+    def point_rect(self):  # Rectangle around the point, used for collisions and redrawing
+        return pygame.Rect(self.point.x - self.point.radius, self.point.y - self.point.radius,
+                           self.point.radius * 2, self.point.radius * 2)
 
     def move_point(self):  # Method which moves point
         old_x, old_y = self.point.x, self.point.y  # Safe coordinates in case of wall_collision
@@ -240,28 +366,11 @@ class Game:
             self.point.x, self.point.y = old_x, old_y
 
     def check_wall_collision(self):
-        walls = list(filter(lambda obj: isinstance(obj, Wall), self.room_objects))
-        point_rect = pygame.Rect(self.point.x - self.point.radius, self.point.y - self.point.radius,
-                                 self.point.radius * 2, self.point.radius * 2)
-        return any(wall.figure.colliderect(point_rect) for wall in walls)
+        return self.point_rect().collidelist(self.current_room.wall_rects) != -1
 
     def change_room(self, door):
         if door.direction == 'exit':
             self.game_over_menu()
-<<<<<<< Updated upstream
-        else:
-            direction_to_room = {'left': (self.current_room.left_way, (110, 455)),
-                                 'right': (self.current_room.right_way, (520, 455)),
-                                 'back': (self.current_room.back_way, (320, 25))}
-            new_room, self.current_room.spawn = direction_to_room[door.direction]
-            if not new_room.visited:
-                self.mini_game.run()
-                new_room.visited = True
-            self.point.x, self.point.y = new_room.spawn
-            self.room_objects = new_room.room_objects
-            self.current_room = new_room
-            self.steps_to_exit += 1
-=======
             return
 
         spawn_offset = -15 if door.direction in ['left', 'right'] else 15
@@ -270,86 +379,140 @@ class Game:
         new_room = self.current_room.adjacent_rooms[door.direction]
         self.point.spawn = self.current_room.spawn
         self.point.x, self.point.y = new_room.spawn
-        self.current_room = new_room
+        self.enter_room(new_room)
         self.steps += 1
         if not new_room.visited:
-            self.mini_game.run()
+            if not self.mini_game.run():
+                self.running = False  # The window was closed during the mini game
+                return
             new_room.visited = True
->>>>>>> Stashed changes
+            self.frame_loop.resume()
 
     def game_logic(self):
         self.move_point()
-        doors = list(filter(lambda obj: isinstance(obj, Door), self.room_objects))
-        for door in doors:
+        for door in self.current_room.doors:
             if door.figure.collidepoint(self.point.x, self.point.y):
                 self.change_room(door)
                 break
 
     def game_over_menu(self):
-<<<<<<< Updated upstream
-        message = f'{self.steps_to_exit} vs {self.maze.steps_to_exit}'
-=======
-        message = f'Your: {self.steps}, DFS: {self.maze.dfs()}'
->>>>>>> Stashed changes
+        message = f'Your: {self.steps}, Shortest: {self.maze.shortest_distance}'
         text = pygame.font.Font(None, 36).render(message, True, (255, 255, 255))
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                    pygame.quit()
-                    self.running = False
-                    return
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    self.restart_game()
-                    return
+        state = {'running': True}  # Changed by the event handler to close the menu
+        frame_loop = FrameLoop()
+
+        def handle_event(event):
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
+                pygame.quit()
+                self.running = False
+                state['running'] = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                self.restart_game()
+                state['running'] = False
+
+        def render():
             self.screen.fill((0, 0, 0))
             self.screen.blit(text, (50, 50))
+            frame_loop.draw_stats(self.screen)
             pygame.display.flip()
 
+        frame_loop.run(lambda: state['running'], handle_event, lambda: None, render)
+        if self.running:
+            self.frame_loop.resume()
+
     def restart_game(self):
-        self.maze = Maze(7)
-        self.current_room = self.maze.start_room
-<<<<<<< Updated upstream
-        self.room_objects = self.current_room.room_objects
-        self.steps_to_exit = 0
-=======
+        self.maze = Maze(self.maze_size, self.maze_seeds.random())
+        self.enter_room(self.maze.start_room)
         self.steps = 0
->>>>>>> Stashed changes
         self.point = Point(5, 5)
 
     def render(self):  # Define a method to render (draw) the game state on the screen
-        self.screen.fill((0, 0, 0))  # Fill the screen with black color
-        pygame.draw.circle(self.screen, self.point.colour, (self.point.x, self.point.y), self.point.radius)
-        for obj in self.room_objects:
-            pygame.draw.rect(self.screen, obj.colour, obj.figure)  # Draw all room objects
-        pygame.display.flip()  # Update the screen
+        background = self.current_room.background
+        point_rect = self.point_rect().inflate(2, 2)  # One pixel margin for the edge of the circle
+        if self.full_redraw:  # New room or another screen was shown, draw everything once
+            self.screen.blit(background, (0, 0))
+            pygame.draw.circle(self.screen, self.point.colour, (self.point.x, self.point.y), self.point.radius)
+            self.frame_loop.stats_rect = None  # The overlay was wiped by the background
+            self.frame_loop.draw_stats(self.screen, background)
+            if self.show_hint:
+                self.draw_hint()
+            pygame.display.flip()
+            self.full_redraw = False
+        else:  # Only the area around the point changes, so only that is drawn and updated
+            self.screen.blit(background, self.last_point_rect, self.last_point_rect)  # Erase the old point
+            pygame.draw.circle(self.screen, self.point.colour, (self.point.x, self.point.y), self.point.radius)
+            changed = [self.last_point_rect, point_rect]
+            stats_rect = self.frame_loop.draw_stats(self.screen, background)
+            if stats_rect:
+                changed.append(stats_rect)
+            elif self.frame_loop.stats_rect:  # The overlay was just switched off
+                self.screen.blit(background, self.frame_loop.stats_rect, self.frame_loop.stats_rect)
+                changed.append(self.frame_loop.stats_rect)
+                self.frame_loop.stats_rect = None
+            pygame.display.update(changed)
+        self.last_point_rect = point_rect
+
+    def hint_text(self):
+        room = self.current_room
+        if room.next_hop is None:
+            return 'Exit: in this room'
+        return f'Exit: {room.next_hop} door, {room.distance_to_exit} rooms'
+
+    def draw_hint(self):  # Method which draws the hint in the top right corner, outside every room's walls
+        # Only drawn on a full redraw (entering a room or toggling the hint), the point never reaches that corner
+        text = self.hint_font.render(self.hint_text(), True, (0, 255, 0))
+        self.screen.blit(text, text.get_rect(topright=(SCREEN_SIZE[0] - 5, 5)))
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:  # If the window closure is triggered.
+            self.running = False  # Stop the game loop.
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+            self.show_hint = not self.show_hint
+            self.full_redraw = True
 
     def run(self):  # Define the MAIN GAME LOOP method.
-        while self.running:  # Keep running the game loop until 'running' is False.
-            for event in pygame.event.get():  # Process all events in the event queue.
-                if event.type == pygame.QUIT:  # If the window closure is triggered.
-                    self.running = False  # Stop the game loop.
-            self.render()  # Call the 'render' method to draw the game state on the screen.
-            self.game_logic()
+        # Logic runs at a fixed rate and the screen is drawn once per frame, until 'running' is False.
+        self.frame_loop.run(lambda: self.running, self.handle_event, self.game_logic, self.render)
 
 
 class MiniGame:
     def __init__(self, screen):
         self.screen = screen
 
-    def run(self):
-        mini_game_running = True
+    def run(self):  # Returns False when the window was closed instead of finishing the mini game
+        state = {'running': True, 'finished': False}
         text = pygame.font.Font(None, 36).render('Press SPACE to finish the mini game', True, (255, 255, 255))
-        while mini_game_running:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    mini_game_running = False
-                elif event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
+        frame_loop = FrameLoop()
+
+        def handle_event(event):
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                state['running'] = False
+                state['finished'] = True
+            elif event.type == pygame.QUIT:
+                pygame.quit()
+                state['running'] = False
+
+        def render():
             self.screen.fill((0, 0, 0))
             self.screen.blit(text, (50, 50))
+            frame_loop.draw_stats(self.screen)
             pygame.display.flip()
 
+        frame_loop.run(lambda: state['running'], handle_event, lambda: None, render)
+        return state['finished']
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maze game")
+    parser.add_argument('--maze-size', type=int, default=MAZE_SIZE, help="number of rooms in the maze")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible mazes")
+    parser.add_argument('--maze-report', type=int, nargs='+', metavar='SIZE',
+                        help="print generation time and memory for mazes of these sizes instead of playing")
+    args = parser.parse_args()
 
-game = Game()  # create an instance of the 'Game' class
-game.run()  # start the game loop by calling the 'run' method of the game instance
+    if args.maze_report:
+        for size in args.maze_report:
+            print(size, maze_generation_report(size, args.seed))
+    else:
+        game = Game(args.maze_size, args.seed)  # create an instance of the 'Game' class
+        game.run()  # start the game loop by calling the 'run' method of the game instance